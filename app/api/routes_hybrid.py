@@ -2,17 +2,83 @@
 
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
 from fastapi.responses import FileResponse
-import shutil
+import asyncio
+import logging
 import os
-import json
+import sqlite3
+import stat
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import List
+import orjson
 import re
-from app.services.gemini_hybrid import extract_resume_data, analyze_and_score, apply_changes
+from io import BytesIO
+from app.services.gemini_hybrid import extract_resume_data, extract_resume_data_with_source, analyze_and_score, apply_changes
 from app.services.generator import generate_ats_resume
-from app.utils.helpers import ensure_directories
+from app.utils.cache import PersistentCache, make_cache_key
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
-ensure_directories()
+# Characters not allowed in generated output filenames
+_FILENAME_UNSAFE_RE = re.compile(r'[^\w\-]')
+
+# On-disk memo of /analyze scores and suggestions (rule-based mode only), kept for a day
+analysis_cache = PersistentCache("analysis.sqlite3", default_ttl=86400)
+
+
+def _cache_get(key: str):
+    """analysis_cache.get that treats SQLite errors (locked, read-only, disk full) as a miss"""
+    try:
+        return analysis_cache.get(key)
+    except sqlite3.Error as e:
+        logger.warning("Analysis cache read failed: %s", e)
+        return None
+
+
+def _cache_set(key: str, value: dict) -> None:
+    """analysis_cache.set that logs and ignores SQLite errors - caching is best-effort"""
+    try:
+        analysis_cache.set(key, value)
+    except sqlite3.Error as e:
+        logger.warning("Analysis cache write failed: %s", e)
+
+
+# Upload limits and file signatures (magic bytes) of the supported formats
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+_FILE_SIGNATURES = {
+    'pdf': (b'%PDF',),
+    'docx': (b'PK\x03\x04',),
+    'doc': (b'PK\x03\x04',),  # Only DOCX content with a .doc name: legacy OLE .doc can't be parsed
+}
+
+
+async def _read_upload(resume: UploadFile) -> bytes:
+    """
+    Validate an uploaded resume and return its contents
+    Rejects unsupported types (extension + magic bytes) and oversized files before reading the body
+    """
+    extension = resume.filename.lower().rsplit('.', 1)[-1] if resume.filename else ''
+    if extension not in _FILE_SIGNATURES:
+        raise HTTPException(status_code=400, detail="Only PDF and DOCX files are supported")
+
+    if resume.size is not None and resume.size > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="File too large (max 10MB)")
+
+    head = await resume.read(8)
+    if not head.startswith(_FILE_SIGNATURES[extension]):
+        raise HTTPException(status_code=400, detail=f"File content does not match a {extension.upper()} document")
+    await resume.seek(0)
+
+    data = await resume.read(MAX_UPLOAD_BYTES + 1)
+    if len(data) > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="File too large (max 10MB)")
+    return data
+
+
+class DocxFileResponse(FileResponse):
+    """FileResponse streaming in 256 KB chunks (Starlette default is 64 KB)"""
+    chunk_size = 256 * 1024
 
 
 @router.post("/analyze")
@@ -33,34 +99,120 @@ async def analyze_resume(
     - extracted_data: Parsed resume data
     """
     try:
-        # Validate file type
-        if not resume.filename.lower().endswith(('.pdf', '.docx', '.doc')):
-            raise HTTPException(status_code=400, detail="Only PDF and DOCX files are supported")
-
-        # Save uploaded file
-        file_path = f"uploads/{resume.filename}"
-        with open(file_path, "wb") as f:
-            shutil.copyfileobj(resume.file, f)
+        # Validate file type/size and read upload into memory (no disk round-trip)
+        data = await _read_upload(resume)
 
         # Extract data using hybrid processing
-        extracted = extract_resume_data(file_path, job_role, job_desc or "")
+        # Blocking parsing/scoring runs in a worker thread so the event loop stays free
+        extracted, extraction_source = await asyncio.to_thread(
+            extract_resume_data_with_source, BytesIO(data), job_role, job_desc or "", resume.filename
+        )
+
+        # Fully rule-based scores are deterministic for (file, role, description): serve repeats from cache.
+        # Only the score fields are stored; extracted_data (personal details) is never written to disk
+        cache_key = None
+        if not use_api_for_suggestions and extraction_source == 'rule_based':
+            cache_key = make_cache_key('scores', data, job_role.lower().strip(), (job_desc or "").lower().strip())
+            cached = await asyncio.to_thread(_cache_get, cache_key)
+            if cached is not None:
+                return {**cached, "extracted_data": extracted}
 
         # Score and suggest using hybrid processing
-        analysis = analyze_and_score(extracted, job_role, job_desc or "", use_api_for_suggestions)
+        analysis = await asyncio.to_thread(
+            analyze_and_score, extracted, job_role, job_desc or "", use_api_for_suggestions
+        )
+
+        scores = {
+            "ats_score": analysis.get("ats_score", 0),
+            "score_breakdown": analysis.get("score_breakdown", {}),
+            "explanation": analysis.get("explanation", ""),
+            "suggestions": analysis.get("suggestions", [])
+        }
+        # Only cache when scoring didn't fall back to the (nondeterministic) LLM either
+        if cache_key is not None and analysis.get('source') == 'rule_based':
+            await asyncio.to_thread(_cache_set, cache_key, scores)
+
+        return {**scores, "extracted_data": extracted}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
-        # Cleanup uploaded file
-        os.remove(file_path)
 
+def _analyze_one(data: bytes, filename: str, job_role: str, job_desc: str) -> dict:
+    """Extract and score a single resume (runs in a worker process for /analyze_batch)"""
+    try:
+        extracted = extract_resume_data(BytesIO(data), job_role, job_desc, filename=filename)
+        analysis = analyze_and_score(extracted, job_role, job_desc)
         return {
+            "filename": filename,
             "ats_score": analysis.get("ats_score", 0),
             "score_breakdown": analysis.get("score_breakdown", {}),
             "explanation": analysis.get("explanation", ""),
             "suggestions": analysis.get("suggestions", []),
             "extracted_data": extracted
         }
-
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
+        return {"filename": filename, "error": f"Analysis failed: {str(e)}"}
+
+
+# Batch limits: files per /analyze_batch request and seconds to wait on worker-process jobs
+MAX_BATCH_FILES = 20
+PROCESS_POOL_TIMEOUT = 120
+
+_process_pool = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """
+    Process pool shared by batch analysis and DOCX generation, created on first use
+    Workers are spawned (not forked) so they don't inherit the parent's threads, locks or executors
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=get_context("spawn"))
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Stop the shared worker processes (called on application shutdown)"""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+@router.post("/analyze_batch")
+async def analyze_resume_batch(
+    resumes: List[UploadFile] = File(..., description="Upload multiple PDF or DOCX resumes"),
+    job_role: str = Form(..., description="Target job role"),
+    job_desc: str = Form(None, description="Job description")
+):
+    """
+    Analyze several resumes against the same role in parallel (rule-based scoring)
+
+    Returns:
+    - results: One entry per uploaded file, in upload order, with the same fields as /analyze
+      (or an "error" field if that file could not be processed)
+    """
+    if len(resumes) > MAX_BATCH_FILES:
+        raise HTTPException(status_code=413, detail=f"Too many files (max {MAX_BATCH_FILES} per batch)")
+
+    # Validate and read every upload first - UploadFile objects can't be sent to worker processes
+    uploads = [(await _read_upload(resume), resume.filename) for resume in resumes]
+
+    loop = asyncio.get_running_loop()
+    pool = _get_process_pool()
+    try:
+        results = await asyncio.wait_for(asyncio.gather(*[
+            loop.run_in_executor(pool, _analyze_one, data, filename, job_role, job_desc or "")
+            for data, filename in uploads
+        ]), timeout=PROCESS_POOL_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Batch analysis timed out")
+
+    return {"results": results}
 
 
 @router.post("/optimize")
@@ -78,34 +230,33 @@ async def optimize_resume(
     - download_url: URL to download optimized resume
     - applied_changes: List of changes made
     """
-    # Debug: Print received values
-    print(f"DEBUG: job_role='{job_role}', job_desc='{job_desc}', suggestions='{suggestions}', use_api_for_optimization={use_api_for_optimization}")
+    # Debug: Log received values (formatted only when DEBUG logging is enabled)
+    logger.debug(
+        "job_role=%r job_desc=%r suggestions=%r use_api_for_optimization=%s",
+        job_role, job_desc, suggestions, use_api_for_optimization
+    )
     
     try:
-        # Validate file type and saving uploaded file
-        if not resume.filename.lower().endswith(('.pdf', '.docx', '.doc')):
-            raise HTTPException(status_code=400, detail="Only PDF and DOCX files are supported")
-
-        file_path = f"uploads/{resume.filename}"
-        with open(file_path, "wb") as f:
-            shutil.copyfileobj(resume.file, f)
+        # Validate file type/size and read uploaded file
+        data = await _read_upload(resume)
 
         # Parse suggestions and Extract and optimize data
-        suggestions_list = json.loads(suggestions) if suggestions else []
-        extracted = extract_resume_data(file_path, job_role, job_desc or "")
-        optimized_data = apply_changes(extracted, suggestions_list, job_role, job_desc or "", use_api_for_optimization)
+        suggestions_list = orjson.loads(suggestions) if suggestions else []
+        extracted = await asyncio.to_thread(
+            extract_resume_data, BytesIO(data), job_role, job_desc or "", filename=resume.filename
+        )
+        optimized_data = await asyncio.to_thread(
+            apply_changes, extracted, suggestions_list, job_role, job_desc or "", use_api_for_optimization
+        )
 
         # Generate optimized resume with proper filename
-        base_name = resume.filename
-        while '.' in base_name:
-            base_name = base_name.rsplit('.', 1)[0]
-        base_name = re.sub(r'[^\w\-_\.]', '_', base_name)
+        base_name = _FILENAME_UNSAFE_RE.sub('_', resume.filename.split('.', 1)[0])
         output_filename = f"optimized_{base_name}.docx"
         output_path = f"outputs/{output_filename}"
-        generate_ats_resume(optimized_data, output_path)
-
-        # Clean the uploaded file
-        os.remove(file_path)
+        # DOCX building is CPU-bound lxml work; run it in a worker process so generations scale across cores
+        await asyncio.wait_for(asyncio.get_running_loop().run_in_executor(
+            _get_process_pool(), generate_ats_resume, optimized_data, output_path
+        ), timeout=PROCESS_POOL_TIMEOUT)
 
         return {
             "download_url": f"/download/{output_filename}",
@@ -113,6 +264,10 @@ async def optimize_resume(
             "optimized_data": optimized_data
         }
 
+    except HTTPException:
+        raise
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Resume generation timed out")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Optimization failed: {str(e)}")
 
@@ -123,12 +278,18 @@ async def download_resume(filename: str):
     Download optimized resume file
     """
     file_path = f"outputs/{filename}"
-    if not os.path.exists(file_path):
+    # One stat both checks the file and is handed to the response, which would otherwise stat it again
+    try:
+        stat_result = os.stat(file_path)
+    except (OSError, ValueError):
+        raise HTTPException(status_code=404, detail="File not found")
+    if not stat.S_ISREG(stat_result.st_mode):
         raise HTTPException(status_code=404, detail="File not found")
 
-    return FileResponse(
+    return DocxFileResponse(
         path=file_path,
         filename=filename,
+        stat_result=stat_result,
         media_type='application/vnd.openxmlformats-officedocument.wordprocessingml.document'
     )
 
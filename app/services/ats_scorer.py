@@ -1,36 +1,86 @@
 import re
-from typing import Dict, List, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, FrozenSet, List, Tuple
 from collections import Counter
+from operator import itemgetter
+import heapq
 import math
+from app.utils.helpers import flatten_strings
+
+
+# Quantifiable achievement markers: percentages, multiples, money, "N+" and growth verbs followed by a number
+_QUANT_RE = re.compile(r'\d+%|\d+x|\$\d+|\d+\+|(?:increased|reduced|improved|grew).*\d', re.IGNORECASE)
+_WORD_RE = re.compile(r'\b[a-z]+\b')
+_TOKEN_RE = re.compile(r'[a-z0-9+./#-]+')
+
+
+@dataclass
+class _ResumeView:
+    """Resume fields read by the _score_* methods, derived once per scorer"""
+    skills_lower: List[str]
+    skills_joined: str  # skills_lower joined by newlines, for "contained in any skill" checks
+    experience_points: List[List[str]]  # bullet points of each experience entry
+    project_count: int
+    summary_length: int
+    has_name: bool
+    has_email: bool
+    has_phone: bool
+    has_linkedin: bool
+    has_education: bool
+    has_certifications: bool
+    has_achievements: bool
+
+    @classmethod
+    def from_resume(cls, resume_data: Dict) -> "_ResumeView":
+        personal = resume_data.get('personal') or {}
+        skills_lower = [s.lower() for s in resume_data.get('skills') or []]
+        return cls(
+            skills_lower=skills_lower,
+            skills_joined='\n'.join(skills_lower),
+            experience_points=[exp.get('points') or [] for exp in resume_data.get('experience') or []],
+            project_count=len(resume_data.get('projects') or []),
+            summary_length=len(resume_data.get('summary') or ''),
+            has_name=bool(personal.get('name')),
+            has_email=bool(personal.get('email')),
+            has_phone=bool(personal.get('phone')),
+            has_linkedin=bool(personal.get('linkedin')),
+            has_education=bool(resume_data.get('education')),
+            has_certifications=bool(resume_data.get('certifications')),
+            has_achievements=bool(resume_data.get('achievements')),
+        )
 
 
 class ATSScorer:
     """Calculate ATS score using rule-based keyword matching and heuristics"""
     
     # Common ATS-friendly role skills mapping that can be expanded with more roles and skills as needed just in case fallback to role-based skills if job description doesn't provide enough keywords
+    # Values are tuples so they are immutable and can be returned from the cached lookups as-is
     ROLE_SKILLS = {
-        'software engineer': ['python', 'java', 'javascript', 'git', 'sql', 'api', 'testing', 'agile', 'oop', 'data structures'],
-        'data scientist': ['python', 'machine learning', 'sql', 'statistics', 'pandas', 'numpy', 'tensorflow', 'r', 'visualization', 'deep learning'],
-        'frontend developer': ['react', 'javascript', 'html', 'css', 'typescript', 'vue', 'angular', 'responsive', 'ui/ux', 'webpack'],
-        'backend developer': ['python', 'java', 'node.js', 'sql', 'api', 'docker', 'kubernetes', 'microservices', 'rest', 'mongodb'],
-        'full stack developer': ['react', 'node.js', 'javascript', 'sql', 'api', 'git', 'docker', 'mongodb', 'rest', 'html/css'],
-        'devops engineer': ['docker', 'kubernetes', 'ci/cd', 'aws', 'linux', 'terraform', 'jenkins', 'ansible', 'monitoring', 'scripting'],
-        'data engineer': ['python', 'sql', 'spark', 'kafka', 'etl', 'data pipeline', 'aws', 'airflow', 'big data', 'hadoop'],
-        'ml engineer': ['python', 'tensorflow', 'pytorch', 'machine learning', 'deep learning', 'mlops', 'docker', 'kubernetes', 'model deployment'],
-        'product manager': ['agile', 'scrum', 'roadmap', 'stakeholder', 'analytics', 'user research', 'jira', 'sql', 'a/b testing'],
-        'qa engineer': ['testing', 'automation', 'selenium', 'api testing', 'test cases', 'bug tracking', 'ci/cd', 'quality assurance'],
+        'software engineer': ('python', 'java', 'javascript', 'git', 'sql', 'api', 'testing', 'agile', 'oop', 'data structures'),
+        'data scientist': ('python', 'machine learning', 'sql', 'statistics', 'pandas', 'numpy', 'tensorflow', 'r', 'visualization', 'deep learning'),
+        'frontend developer': ('react', 'javascript', 'html', 'css', 'typescript', 'vue', 'angular', 'responsive', 'ui/ux', 'webpack'),
+        'backend developer': ('python', 'java', 'node.js', 'sql', 'api', 'docker', 'kubernetes', 'microservices', 'rest', 'mongodb'),
+        'full stack developer': ('react', 'node.js', 'javascript', 'sql', 'api', 'git', 'docker', 'mongodb', 'rest', 'html/css'),
+        'devops engineer': ('docker', 'kubernetes', 'ci/cd', 'aws', 'linux', 'terraform', 'jenkins', 'ansible', 'monitoring', 'scripting'),
+        'data engineer': ('python', 'sql', 'spark', 'kafka', 'etl', 'data pipeline', 'aws', 'airflow', 'big data', 'hadoop'),
+        'ml engineer': ('python', 'tensorflow', 'pytorch', 'machine learning', 'deep learning', 'mlops', 'docker', 'kubernetes', 'model deployment'),
+        'product manager': ('agile', 'scrum', 'roadmap', 'stakeholder', 'analytics', 'user research', 'jira', 'sql', 'a/b testing'),
+        'qa engineer': ('testing', 'automation', 'selenium', 'api testing', 'test cases', 'bug tracking', 'ci/cd', 'quality assurance'),
     }
     
     def __init__(self, resume_data: Dict, job_role: str, job_desc: str = ""):
         self.resume_data = resume_data
         self.job_role = job_role.lower()
         self.job_desc = job_desc.lower()
-        self.resume_text = self._get_resume_text().lower()
+        self.resume_text = self._get_resume_text()
+        self._resume_words = frozenset(_TOKEN_RE.findall(self.resume_text))
+        self._view = _ResumeView.from_resume(resume_data)
     
     def _get_resume_text(self) -> str:
-        """Convert resume data to searchable text"""
-        import json
-        return json.dumps(self.resume_data)
+        """Convert resume data to lowercased searchable text (string values only)"""
+        return " ".join(flatten_strings(self.resume_data)).lower()
     
     def calculate_score(self) -> Tuple[int, Dict[str, int], str]:
         """
@@ -61,8 +111,10 @@ class ATSScorer:
         if not keywords:
             return 15
         
-        # Count matches in resume
-        matches = sum(1 for kw in keywords if kw in self.resume_text)
+        # Count matches in resume: whole-word hits are a set lookup, the rest
+        # (keywords appearing only inside a longer word) fall back to substring search
+        hits = self._resume_words.intersection(keywords)
+        matches = len(hits) + sum(1 for kw in keywords if kw not in hits and kw in self.resume_text)
         match_rate = matches / len(keywords)
         
         # Calculate score with diminishing returns
@@ -77,13 +129,15 @@ class ATSScorer:
         """Score based on relevant skills for the role (25 points max)"""
         # Get expected skills for role
         role_skills = self._get_expected_skills()
-        user_skills = [s.lower() for s in self.resume_data.get('skills', [])]
+        user_skills = self._view.skills_lower
         
         if not role_skills:
             # If role not in mapping, use generic scoring
             return min(25, len(user_skills) * 2)
         
-        matches = sum(1 for rs in role_skills if any(rs in us for us in user_skills))
+        # A role skill (never containing a newline) is inside some user skill iff it is inside the joined text
+        skills_joined = self._view.skills_joined
+        matches = sum(1 for rs in role_skills if rs in skills_joined)
         match_rate = matches / len(role_skills)
         
         # Bonus for having extra relevant skills
@@ -98,16 +152,18 @@ class ATSScorer:
     # - Experience section clarity and detail
     def _score_format_quality(self) -> int:
         """Score resume format and structure (20 points max)"""
+        view = self._view
         score = 0
         
         # Has professional summary (5 points)
-        if self.resume_data.get('summary') and len(self.resume_data['summary']) > 50:
+        if view.summary_length > 50:
             score += 5
         
         # Has adequate skills listed (5 points)
-        if len(self.resume_data.get('skills', [])) >= 5:
+        skill_count = len(view.skills_lower)
+        if skill_count >= 5:
             score += 5
-        elif len(self.resume_data.get('skills', [])) >= 3:
+        elif skill_count >= 3:
             score += 3
         
         # Experience bullet points are detailed (5 points)
@@ -115,13 +171,7 @@ class ATSScorer:
         score += exp_quality
         
         # Contact information complete (5 points)
-        personal = self.resume_data.get('personal', {})
-        contact_score = sum([
-            2 if personal.get('email') else 0,
-            1 if personal.get('phone') else 0,
-            1 if personal.get('linkedin') else 0,
-            1 if personal.get('name') else 0,
-        ])
+        contact_score = 2 * view.has_email + view.has_phone + view.has_linkedin + view.has_name
         score += min(5, contact_score)
         
         return min(20, score)
@@ -132,23 +182,19 @@ class ATSScorer:
     # - Quality of experience descriptions (quantifiable achievements, clarity)
     def _score_experience_alignment(self) -> int:
         """Score work experience relevance (15 points max)"""
-        experiences = self.resume_data.get('experience', [])
+        experience_points = self._view.experience_points
         
-        if not experiences:
+        if not experience_points:
             # Check projects as alternative
-            projects = self.resume_data.get('projects', [])
-            if projects:
-                return min(10, len(projects) * 3)
-            return 0
+            return min(10, self._view.project_count * 3)
         
         score = 0
         
         # Number of experiences (max 5 points)
-        score += min(5, len(experiences) * 2)
+        score += min(5, len(experience_points) * 2)
         
         # Quality of experience descriptions (max 10 points)
-        for exp in experiences:
-            points = exp.get('points', [])
+        for points in experience_points:
             if len(points) >= 3:
                 score += 3
             elif len(points) >= 1:
@@ -167,20 +213,21 @@ class ATSScorer:
     # - Optional sections (certifications, achievements) add small bonus
     def _score_completeness(self) -> int:
         """Score resume completeness (10 points max)"""
+        view = self._view
         score = 0
         
         # Required sections
-        if self.resume_data.get('personal', {}).get('name'):
+        if view.has_name:
             score += 2
-        if self.resume_data.get('skills'):
+        if view.skills_lower:
             score += 2
-        if self.resume_data.get('experience') or self.resume_data.get('projects'):
+        if view.experience_points or view.project_count:
             score += 3
-        if self.resume_data.get('education'):
+        if view.has_education:
             score += 2
-        if self.resume_data.get('certifications'):
+        if view.has_certifications:
             score += 0.5
-        if self.resume_data.get('achievements'):
+        if view.has_achievements:
             score += 0.5
         
         return min(10, int(score))
@@ -189,92 +236,39 @@ class ATSScorer:
     # - Keyword extraction focuses on identifying important terms from the job description while filtering out common stop words and less relevant terms.
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract important keywords from job description"""
-        # Remove common stop words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
-            'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should',
-            'could', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those'
-        }
-        
-        # Extract words and filter out short/common words and counter frequency
-        words = re.findall(r'\b[a-z]+\b', text.lower())
-        filtered = [w for w in words if len(w) > 3 and w not in stop_words]
-        word_freq = Counter(filtered)
-        
-        # Get top keywords (mentioned more than once or technical terms) mentioned in job description more than 20 times or are in the tech terms list
-        tech_terms = set(self._get_all_tech_terms())
-        keywords = []
-        
-        for word, freq in word_freq.most_common(30):
-            if freq > 1 or word in tech_terms:
-                keywords.append(word)
-        
-        return keywords[:20] 
+        return list(_keywords_from_text(text.lower()))
     
 
     # Get expected skills for the job role based on predefined mapping and job description analysis
     # - This method first tries to find an exact match for the job role in the predefined ROLE_SKILLS mapping. 
     # - If no exact match is found, it looks for partial matches (e.g., "software engineer" might match "senior software engineer"). 
     # - If still no match is found, it attempts to extract relevant skills directly from the job description using keyword analysis.
-    def _get_expected_skills(self) -> List[str]:
+    def _get_expected_skills(self) -> Tuple[str, ...]:
         """Get expected skills for job role"""
-        # Try exact match first
-        if self.job_role in self.ROLE_SKILLS:
-            return self.ROLE_SKILLS[self.job_role]
-        
-        # Try partial match
-        for role, skills in self.ROLE_SKILLS.items():
-            if role in self.job_role or self.job_role in role:
-                return skills
+        # Exact or partial role match first
+        skills = _expected_skills_for(self.job_role)
+        if skills:
+            return skills
         
         # Extract from job description if available
         if self.job_desc:
             return self._extract_skills_from_jd()
         
-        return []
+        return ()
     
-    def _extract_skills_from_jd(self) -> List[str]:
+    def _extract_skills_from_jd(self) -> Tuple[str, ...]:
         """Extract technical skills from job description"""
-        tech_terms = self._get_all_tech_terms()
-        found_skills = []
-        
-        for term in tech_terms:
-            if term in self.job_desc:
-                found_skills.append(term)
-        
-        return found_skills[:15]
+        return _skills_from_jd(self.job_desc)
     
     def _get_all_tech_terms(self) -> List[str]:
         """Get comprehensive list of technical terms"""
-        all_skills = set()
-        for skills in self.ROLE_SKILLS.values():
-            all_skills.update(skills)
-        
-        # Add more common tech terms
-        additional_terms = [
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin',
-            'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring', 'laravel',
-            'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'cassandra',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'ansible',
-            'git', 'github', 'gitlab', 'ci/cd', 'jenkins', 'travis',
-            'api', 'rest', 'graphql', 'microservices', 'serverless',
-            'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'scikit-learn',
-            'html', 'css', 'sass', 'tailwind', 'bootstrap',
-            'agile', 'scrum', 'jira', 'confluence'
-        ]
-        
-        all_skills.update(additional_terms)
-        return list(all_skills)
+        return list(_ALL_TECH_TERMS)
     
     def _check_experience_quality(self) -> int:
         """Check quality of experience descriptions"""
         score = 0
-        experiences = self.resume_data.get('experience', [])
         
-        for exp in experiences[:3]:  # Check top 3 experiences
-            points = exp.get('points', [])
-            
+        for points in self._view.experience_points[:3]:  # Check top 3 experiences
             # Has multiple bullet points
             if len(points) >= 3:
                 score += 1
@@ -293,21 +287,7 @@ class ATSScorer:
     def _has_quantifiable_achievement(self, text: str) -> bool:
         """Check if text contains quantifiable achievements"""
         # Look for numbers, percentages, metrics
-        patterns = [
-            r'\d+%',  # Percentages
-            r'\d+x',  # Multiples
-            r'\$\d+',  # Money
-            r'\d+\+',  # Numbers with +
-            r'increased.*\d+',
-            r'reduced.*\d+',
-            r'improved.*\d+',
-            r'grew.*\d+',
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, text.lower()):
-                return True
-        return False
+        return bool(_QUANT_RE.search(text))
     
     def _generate_explanation(self, breakdown: Dict[str, int]) -> str:
         """Generate human-readable explanation of score"""
@@ -353,6 +333,74 @@ class ATSScorer:
         return explanation
 
 
+# Common tech terms on top of the role skills, used for keyword weighting and JD skill extraction
+_ADDITIONAL_TECH_TERMS = frozenset({
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin',
+    'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring', 'laravel',
+    'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'cassandra',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'ansible',
+    'git', 'github', 'gitlab', 'ci/cd', 'jenkins', 'travis',
+    'api', 'rest', 'graphql', 'microservices', 'serverless',
+    'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'scikit-learn',
+    'html', 'css', 'sass', 'tailwind', 'bootstrap',
+    'agile', 'scrum', 'jira', 'confluence'
+})
+
+# Computed once at import instead of on every scoring call
+_ALL_TECH_TERMS: FrozenSet[str] = frozenset(chain.from_iterable(ATSScorer.ROLE_SKILLS.values())) | _ADDITIONAL_TECH_TERMS
+
+
+# Common stop words removed before keyword counting
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should',
+    'could', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those'
+})
+
+
+# The helpers below depend only on the job role / job description, so they are memoized:
+# scoring many resumes against the same posting does the JD analysis once.
+# Results are tuples so cached values can't be mutated by callers.
+
+@lru_cache(maxsize=256)
+def _keywords_from_text(text_lower: str) -> Tuple[str, ...]:
+    """Top keywords of a (lowercased) job description"""
+    # Extract words and filter out short/common words and counter frequency
+    words = _WORD_RE.findall(text_lower)
+    filtered = [w for w in words if len(w) > 3 and w not in _STOP_WORDS]
+    word_freq = Counter(filtered)
+    
+    # Get top keywords (mentioned more than once or technical terms): filter first, then select the top 20
+    candidates = [(w, f) for w, f in word_freq.items() if f > 1 or w in _ALL_TECH_TERMS]
+    top = heapq.nlargest(20, candidates, key=itemgetter(1))
+    
+    return tuple(w for w, _ in top)
+
+
+@lru_cache(maxsize=256)
+def _expected_skills_for(job_role: str) -> Tuple[str, ...]:
+    """Expected skills for a (lowercased) role via exact, then partial, ROLE_SKILLS match"""
+    role_skills = ATSScorer.ROLE_SKILLS
+    
+    # Try exact match first
+    if job_role in role_skills:
+        return role_skills[job_role]
+    
+    # Try partial match
+    for role, skills in role_skills.items():
+        if role in job_role or job_role in role:
+            return skills
+    
+    return ()
+
+
+@lru_cache(maxsize=256)
+def _skills_from_jd(job_desc_lower: str) -> Tuple[str, ...]:
+    """Known technical terms present in a (lowercased) job description"""
+    return tuple([term for term in _ALL_TECH_TERMS if term in job_desc_lower][:15])
+
+
 def calculate_ats_score_rule_based(resume_data: Dict, job_role: str, job_desc: str = "") -> Tuple[int, Dict, str]:
     """
     Calculate ATS score using rule-based approach
@@ -1,18 +1,35 @@
 import google.generativeai as genai
-import json
+import logging
+import orjson
 import os
+import re
+from typing import BinaryIO, Callable, Optional, Tuple, Union
 from dotenv import load_dotenv
-from app.utils.helpers import parse_json_safe
+from app.utils.helpers import parse_json_safe, normalize_whitespace
+from app.utils.cache import MemoryCache, PersistentCache, make_cache_key
 from app.services.parser import extract_text_from_file
 from app.services.rule_based_parser import parse_resume_rule_based
 from app.services.ats_scorer import calculate_ats_score_rule_based
-from app.services.suggestion_generator import generate_suggestions_rule_based
+from app.services.suggestion_generator import SuggestionGenerator
 from app.services.resume_enhancer import apply_suggestions_rule_based
+from app.services.validation import validate
 
 load_dotenv()
+logger = logging.getLogger(__name__)
 genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
 model = genai.GenerativeModel('gemini-2.5-flash')
 
+# Gemini responses cached by prompt hash for two weeks
+llm_cache = PersistentCache("llm_responses.sqlite3", default_ttl=14 * 86400)
+
+# Extracted resume text by content hash, so re-uploads skip PDF/DOCX parsing.
+# In process only (resume text holds personal data) and keyed on the hash, so uploads aren't retained
+text_cache = MemoryCache(maxsize=32)
+
+# Responses holding a resume's personal data (extraction, enhanced sections) stay in process memory
+_IN_MEMORY_ONLY = frozenset({'extract', 'apply_changes'})
+memory_llm_cache = MemoryCache(maxsize=64)
+
 # Configuration flags that can be set true whenever needed but here we are using them as fallbacks when rule-based methods fail or when user explicitly requests API usage. 
 # This allows us to maintain a primarily rule-based approach while leveraging LLM capabilities as needed without incurring unnecessary API calls.
 USE_LLM_FOR_PARSING = False  
@@ -21,35 +38,74 @@ USE_LLM_FOR_SUGGESTIONS = False
 USE_LLM_FOR_ENHANCEMENT = False  
 
 
-def extract_resume_data(file_path: str, job_role: str, job_desc: str) -> dict:
+def _dispatch(task: str, rule_fn: Callable[[], dict], llm_fn: Callable[[], dict], *, use_api: bool,
+              validator: Optional[Callable[[dict], bool]] = None) -> Tuple[dict, str]:
+    """
+    Run the rule-based implementation, falling back to the LLM one when use_api is set,
+    the rule-based step raises, or its result fails validation
+    Returns (result, source) where source is 'rule_based' or 'api'
+    """
+    if use_api:
+        logger.info("Using API for %s (user requested or flag set)", task)
+        return llm_fn(), 'api'
+    
+    try:
+        logger.debug("Using rule-based %s...", task)
+        result = rule_fn()
+        if validator is None or validator(result):
+            logger.debug("Rule-based %s successful", task)
+            return result, 'rule_based'
+        logger.warning("Rule-based %s incomplete, falling back to LLM...", task)
+    except Exception as e:
+        logger.warning("Rule-based %s failed: %s, falling back to LLM...", task, e)
+    
+    return llm_fn(), 'api'
+
+
+def extract_resume_data(file_path: Union[str, bytes, BinaryIO], job_role: str, job_desc: str, filename: Optional[str] = None) -> dict:
     """
     Extract structured data from resume
     PRIMARY: Rule-based parser
     FALLBACK: Gemini AI (if rule-based fails or flag is set)
-    """
-    
-    # Extract text from file
-    resume_text = extract_text_from_file(file_path)
     
-    # Try rule-based parsing first (unless LLM flag is set)
-    if not USE_LLM_FOR_PARSING:
-        try:
-            print("Using rule-based parser...")
-            parsed_data = parse_resume_rule_based(resume_text)
-            
-            # Validate parsed data
-            if _validate_parsed_data(parsed_data):
-                print("Rule-based parsing successful")
-                return parsed_data
-            else:
-                print("Rule-based parsing incomplete, falling back to LLM...")
-        except Exception as e:
-            print(f"Rule-based parsing failed: {str(e)}, falling back to LLM...")
+    file_path may be a path or the in-memory upload (bytes/stream) together with its filename
+    """
+    return extract_resume_data_with_source(file_path, job_role, job_desc, filename)[0]
+
+
+def extract_resume_data_with_source(file_path: Union[str, bytes, BinaryIO], job_role: str, job_desc: str,
+                                    filename: Optional[str] = None) -> Tuple[dict, str]:
+    """extract_resume_data, also returning which path produced the data ('rule_based' or 'api')"""
+    resume_text = _extract_text_cached(file_path, filename)
+    return _dispatch(
+        'parsing',
+        lambda: parse_resume_rule_based(resume_text),
+        lambda: _extract_with_llm(resume_text, job_role, job_desc),
+        use_api=USE_LLM_FOR_PARSING, validator=_validate_parsed_data
+    )
+
+
+def _extract_text_cached(file_path: Union[str, bytes, BinaryIO], filename: Optional[str] = None) -> str:
+    """Extract text via extract_text_from_file, memoized on the file bytes and type"""
+    if isinstance(file_path, str):
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        filename = filename or file_path
+    elif isinstance(file_path, (bytes, bytearray)):
+        data = bytes(file_path)
     else:
-        print("LLM parsing enabled by flag")
+        data = file_path.read()
+    
+    if not filename:
+        raise ValueError("filename is required to detect the type of in-memory files")
     
-    # Fallback to LLM
-    return _extract_with_llm(resume_text, job_role, job_desc)
+    extension = filename.lower().split('.')[-1]
+    cache_key = make_cache_key('text', extension, data)
+    resume_text = text_cache.get(cache_key)
+    if resume_text is None:
+        resume_text = extract_text_from_file(data, filename)
+        text_cache.set(cache_key, resume_text)
+    return resume_text
 
 
 def analyze_and_score(extracted_data: dict, job_role: str, job_desc: str, use_api_for_suggestions: bool = False) -> dict:
@@ -58,39 +114,40 @@ def analyze_and_score(extracted_data: dict, job_role: str, job_desc: str, use_ap
     PRIMARY: Rule-based scoring and suggestions
     FALLBACK: Gemini AI (if rule-based fails or flag is set)
     """
+    return _dispatch(
+        'scoring and suggestions',
+        lambda: _analyze_rule_based(extracted_data, job_role, job_desc),
+        lambda: _analyze_with_llm(extracted_data, job_role, job_desc),
+        use_api=use_api_for_suggestions or USE_LLM_FOR_SCORING or USE_LLM_FOR_SUGGESTIONS
+    )[0]
+
+
+def _analyze_rule_based(extracted_data: dict, job_role: str, job_desc: str) -> dict:
+    """Rule-based score and suggestions"""
     
-    # Check if user requested API or if rule-based should be used
-    if use_api_for_suggestions or USE_LLM_FOR_SCORING or USE_LLM_FOR_SUGGESTIONS:
-        print("Using API for analysis (user requested or fallback)")
-        return _analyze_with_llm(extracted_data, job_role, job_desc)
+    # Suggestion prep (keyword/skill gaps) doesn't need the score
+    generator = SuggestionGenerator(extracted_data, job_role, job_desc)
+    generator.prepare()
     
-    # Try rule-based approach first
-    try:
-        print("Using rule-based scoring and suggestions...")
-        
-        # Calculate score
-        ats_score, score_breakdown, explanation = calculate_ats_score_rule_based(
-            extracted_data, job_role, job_desc
-        )
-        
-        # Generate suggestions
-        suggestions = generate_suggestions_rule_based(
-            extracted_data, job_role, job_desc, score_breakdown
-        )
-        
-        print(f"Rule-based analysis complete - Score: {ats_score}")
-        
-        return {
-            'ats_score': ats_score,
-            'score_breakdown': score_breakdown,
-            'explanation': explanation,
-            'suggestions': suggestions,
-            'source': 'rule_based',
-            'needs_api_check': len(suggestions) < 3  # Flag if few suggestions generated
-        }
-    except Exception as e:
-        print(f"Rule-based analysis failed: {str(e)}, falling back to LLM...")
-        return _analyze_with_llm(extracted_data, job_role, job_desc)
+    # Calculate score
+    ats_score, score_breakdown, explanation = calculate_ats_score_rule_based(
+        extracted_data, job_role, job_desc
+    )
+    
+    # Generate suggestions
+    generator.score_breakdown = score_breakdown
+    suggestions = generator.generate_suggestions()
+    
+    logger.debug("Rule-based analysis - Score: %s", ats_score)
+    
+    return {
+        'ats_score': ats_score,
+        'score_breakdown': score_breakdown,
+        'explanation': explanation,
+        'suggestions': suggestions,
+        'source': 'rule_based',
+        'needs_api_check': len(suggestions) < 3  # Flag if few suggestions generated
+    }
 
 
 def apply_changes(original_data: dict, suggestions: list, job_role: str, job_desc: str, use_api_for_optimization: bool = False) -> dict:
@@ -99,134 +156,93 @@ def apply_changes(original_data: dict, suggestions: list, job_role: str, job_des
     PRIMARY: Rule-based enhancement
     FALLBACK: Gemini AI (if rule-based fails or flag is set)
     """
-    
-    # Check if user requested API or if rule-based should be used
-    if use_api_for_optimization or USE_LLM_FOR_ENHANCEMENT:
-        print("Using API for resume optimization (user requested or fallback)")
-        return _apply_changes_with_llm(original_data, suggestions, job_role, job_desc)
-    
-    # Try rule-based approach first
-    try:
-        print("Using rule-based resume enhancement...")
-        enhanced_data = apply_suggestions_rule_based(
-            original_data, suggestions, job_role, job_desc
-        )
-        
-        # Validate enhanced data
-        if _validate_parsed_data(enhanced_data):
-            print("Rule-based enhancement successful")
-            return enhanced_data
-        else:
-            print("Rule-based enhancement incomplete, falling back to LLM...")
-            return _apply_changes_with_llm(original_data, suggestions, job_role, job_desc)
-    except Exception as e:
-        print(f"Rule-based enhancement failed: {str(e)}, falling back to LLM...")
-        return _apply_changes_with_llm(original_data, suggestions, job_role, job_desc)
+    return _dispatch(
+        'resume enhancement',
+        lambda: apply_suggestions_rule_based(original_data, suggestions, job_role, job_desc),
+        lambda: _apply_changes_with_llm(original_data, suggestions, job_role, job_desc),
+        use_api=use_api_for_optimization or USE_LLM_FOR_ENHANCEMENT, validator=_validate_parsed_data
+    )[0]
 
 
 
 
 # LLM FALLBACK FUNCTIONS
 
-def _extract_with_llm(resume_text: str, job_role: str, job_desc: str) -> dict:
-    """Extract data using Gemini (FALLBACK)"""
-    
-    prompt = f"""You are an expert resume parser and ATS analyzer.
+# Top-level sections of the resume data structure
+RESUME_SECTIONS = ('personal', 'summary', 'skills', 'experience', 'education', 'projects', 'certifications', 'achievements')
 
-INPUT:
-- Resume Content: {resume_text}
-- Target Job Role: {job_role}
-- Job Description: {job_desc if job_desc else "Not provided"}
+# Static instructions + JSON schemas. Each prompt starts with one of these constants (identical bytes
+# on every call) and the per-request data is appended after it, so Gemini's implicit prefix caching
+# can reuse the shared prefix across requests. Keep dynamic values out of these strings.
+
+EXTRACT_SYSTEM_PROMPT = """You are an expert resume parser and ATS analyzer.
 
 TASK:
-Extract ALL information from the resume in this EXACT JSON structure:
+Extract ALL information from the resume given in the INPUT block below in this EXACT JSON structure:
 
-{{
-  "personal": {{
+{
+  "personal": {
     "name": "",
     "email": "",
     "phone": "",
     "linkedin": "",
     "location": ""
-  }},
+  },
   "summary": "",
   "skills": ["skill1", "skill2"],
   "experience": [
-    {{
+    {
       "title": "",
       "company": "",
       "duration": "",
       "points": ["point1", "point2"]
-    }}
+    }
   ],
   "education": [
-    {{
+    {
       "degree": "",
       "institution": "",
       "year": "",
       "gpa": ""
-    }}
+    }
   ],
   "projects": [
-    {{
+    {
       "name": "",
       "description": "",
       "tech": ["tech1"],
       "points": ["point1"]
-    }}
+    }
   ],
   "certifications": ["cert1"],
   "achievements": ["achievement1"]
-}}
+}
 
 RULES:
 - Extract exactly as written, don't modify
 - If section missing, use empty array/string
 - Return ONLY valid JSON, no markdown, no explanation"""
-    
-    response = model.generate_content(prompt)
-    return parse_json_safe(response.text)
 
+ANALYZE_SYSTEM_PROMPT = """ATS Analysis.
 
-def _analyze_with_llm(extracted_data: dict, job_role: str, job_desc: str) -> dict:
-    """Score and suggest using Gemini (FALLBACK)"""
-    
-    prompt = f"""ATS Analysis for {job_role}:
-
-Resume: {json.dumps(extracted_data)}
-Job Desc: {job_desc[:500] if job_desc else "Not provided"}
-
-Calculate ATS score (0-100) and provide 3-5 concise suggestions.
+Using the target role, resume and job description given in the INPUT block below,
+calculate ATS score (0-100) and provide 3-5 concise suggestions.
 
 JSON output only:
-{{
+{
   "ats_score": 75,
-  "score_breakdown": {{"keyword_match": 22, "skills_relevance": 20, "format_quality": 18, "experience_alignment": 10, "completeness": 5}},
+  "score_breakdown": {"keyword_match": 22, "skills_relevance": 20, "format_quality": 18, "experience_alignment": 10, "completeness": 5},
   "explanation": "Brief summary",
   "suggestions": [
-    {{"id": 0, "section": "skills", "change": "Add Python", "reason": "Required", "impact": "+5 points", "priority": "high"}}
+    {"id": 0, "section": "skills", "change": "Add Python", "reason": "Required", "impact": "+5 points", "priority": "high"}
   ],
   "source": "api"
-}}"""
-    
-    response = model.generate_content(prompt)
-    return parse_json_safe(response.text)
+}"""
 
-# we can further break down enhancement into multiple steps if needed, but for simplicity we will do it in one step here. 
-# The prompt can be made more detailed to ensure better results.
-def _apply_changes_with_llm(original_data: dict, suggestions: list, job_role: str, job_desc: str) -> dict:
-    """Apply changes using Gemini (FALLBACK)"""
-    
-    prompt = f"""You are a professional resume writer specializing in ATS optimization.
-
-INPUT:
-- Original Resume Data: {json.dumps(original_data, indent=2)}
-- Accepted Suggestions: {json.dumps(suggestions, indent=2)}
-- Job Role: {job_role}
-- Job Description: {job_desc if job_desc else "Not provided"}
+APPLY_SYSTEM_PROMPT = """You are a professional resume writer specializing in ATS optimization.
 
 TASK:
-Apply all accepted suggestions to the original data and return enhanced resume data.
+Apply all accepted suggestions given in the INPUT block below to the original data and return enhanced resume data.
 
 ENHANCEMENT RULES:
 1. Apply each accepted change to the correct section
@@ -239,52 +255,224 @@ ENHANCEMENT RULES:
 4. Keep professional tone
 5. Quantify achievements where possible
 
-OUTPUT FORMAT (JSON only):
-{{
-  "personal": {{}},
+The Original Resume Data may contain only the sections the suggestions refer to.
+Return exactly those top-level sections, enhanced; other sections are kept unchanged by the caller.
+
+OUTPUT FORMAT (JSON only, same top-level keys as the Original Resume Data), e.g.:
+{
+  "personal": {},
   "summary": "enhanced summary",
   "skills": ["enhanced", "skills"],
-  "experience": [{{}}],
-  "education": [{{}}],
-  "projects": [{{}}],
-  "certifications": [],
-  "achievements": []
-}}
-
-Return ONLY valid JSON with enhanced data, maintaining all original structure. No markdown, no explanation."""
+  "experience": [{}]
+}
+
+Return ONLY valid JSON with enhanced data, maintaining the original structure of each section. No markdown, no explanation."""
+
+
+def _generate_json(fn_name: str, system_prompt: str, request_data: str, cache_key: Optional[str] = None) -> dict:
+    """
+    Call Gemini with [static prefix, per-request data] (streamed) and parse its JSON reply
+    Memoized by SHA-256 of (fn_name, system_prompt, request_data), or by the given cache_key:
+    identical requests (re-uploads, retries) skip the API; unparseable replies are never cached.
+    Replies carrying personal data (_IN_MEMORY_ONLY) are kept in memory, the rest on disk
+    """
+    if cache_key is None:
+        cache_key = make_cache_key(fn_name, system_prompt, request_data)
+    cache = memory_llm_cache if fn_name in _IN_MEMORY_ONLY else llm_cache
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
     
-    response = model.generate_content(prompt)
-    return parse_json_safe(response.text)
+    # Stream the reply, accumulating chunks in a list (joined only when parsing, O(n) overall).
+    # A parse is attempted only when a chunk ends with a closing bracket: once the top-level
+    # JSON value is complete we stop reading instead of waiting for trailing tokens.
+    chunks = []
+    result = None
+    for chunk in model.generate_content([system_prompt, request_data], stream=True):
+        text = chunk.text
+        chunks.append(text)
+        if text.rstrip().endswith(('}', ']')):
+            try:
+                result = parse_json_safe(''.join(chunks))
+                break
+            except ValueError:
+                continue
+    
+    if result is None:
+        result = parse_json_safe(''.join(chunks))
+    cache.set(cache_key, result)
+    return result
 
 
-# VALIDATION HELPERS
+def _extract_with_llm(resume_text: str, job_role: str, job_desc: str) -> dict:
+    """
+    Extract data using Gemini (FALLBACK)
+    Long resumes are split into overlapping chunks at blank-line boundaries, extracted
+    separately and merged, so the prompt size stays bounded
+    """
+    chunks = _chunk_resume(resume_text)
+    if len(chunks) == 1:
+        return _extract_chunk_with_llm(chunks[0], job_role, job_desc)
+    
+    return _merge_extractions([_extract_chunk_with_llm(chunk, job_role, job_desc) for chunk in chunks])
 
-def _validate_parsed_data(data: dict) -> bool:
-    """Validate that parsed data has minimum required fields"""
+
+def _extract_chunk_with_llm(resume_text: str, job_role: str, job_desc: str) -> dict:
+    """Extract data from one piece of resume text using Gemini"""
     
-    # Check required structure
-    if not isinstance(data, dict):
-        return False
+    request_data = f"""INPUT:
+- Resume Content: {resume_text}
+- Target Job Role: {job_role}
+- Job Description: {job_desc if job_desc else "Not provided"}"""
     
-    # Check required top-level keys
-    required_keys = ['personal', 'skills', 'experience', 'education']
-    if not all(key in data for key in required_keys):
-        return False
+    return _generate_json('extract', EXTRACT_SYSTEM_PROMPT, request_data)
+
+
+# Rough token estimate used for chunking: ~4 characters per token
+CHARS_PER_TOKEN = 4
+MAX_EXTRACT_TOKENS = 4000
+CHUNK_OVERLAP = 0.2
+
+# Blank line (optionally whitespace-only) separating resume blocks
+_BLANK_LINE_RE = re.compile(r'\n\s*\n')
+
+
+def _chunk_resume(text: str, max_tokens: int = MAX_EXTRACT_TOKENS, overlap: float = CHUNK_OVERLAP) -> list:
+    """
+    Split resume text into chunks of at most ~max_tokens, on blank-line (section/block) boundaries
+    Each chunk repeats trailing blocks of the previous one (up to `overlap` of the budget) so
+    entries spanning a boundary are seen whole at least once
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return [text]
+    
+    blocks = [block for block in _BLANK_LINE_RE.split(text) if block.strip()]
+    overlap_chars = int(max_chars * overlap)
     
-    # Check personal info has at least name or email
-    personal = data.get('personal', {})
-    if not (personal.get('name') or personal.get('email')):
-        return False
+    chunks = []
+    current = []
+    current_len = 0
+    for block in blocks:
+        if current and current_len + len(block) > max_chars:
+            chunks.append('\n\n'.join(current))
+            # Carry the tail of this chunk over as overlap
+            carried = []
+            carried_len = 0
+            for previous in reversed(current):
+                if carried_len + len(previous) > overlap_chars:
+                    break
+                carried.insert(0, previous)
+                carried_len += len(previous)
+            current, current_len = carried, carried_len
+        current.append(block)
+        current_len += len(block)
+    if current:
+        chunks.append('\n\n'.join(current))
     
-    # Should have at least some content
-    has_content = (
-        len(data.get('skills', [])) > 0 or
-        len(data.get('experience', [])) > 0 or
-        len(data.get('education', [])) > 0 or
-        data.get('summary', '').strip() != ''
+    return chunks
+
+
+# Fields identifying the same entry across chunk extractions (points and durations get reworded)
+_ENTRY_NATURAL_KEYS = {
+    'experience': ('title', 'company'),
+    'education': ('degree', 'institution'),
+    'projects': ('name',),
+}
+
+
+def _entry_identity(section: str, item) -> Union[str, tuple, bytes]:
+    """Deduplication key of a list entry: normalized text, the section's natural key, or the exact JSON"""
+    if isinstance(item, str):
+        return normalize_whitespace(item).lower()
+    fields = _ENTRY_NATURAL_KEYS.get(section)
+    if fields and isinstance(item, dict):
+        natural = tuple(normalize_whitespace(str(item.get(field) or '')).lower() for field in fields)
+        if any(natural):
+            return natural
+    return orjson.dumps(item, option=orjson.OPT_SORT_KEYS)
+
+
+def _merge_extractions(results: list) -> dict:
+    """Merge per-chunk extraction results: first non-empty scalar wins, lists are unioned without duplicates"""
+    merged = {
+        'personal': {}, 'summary': '', 'skills': [], 'experience': [], 'education': [],
+        'projects': [], 'certifications': [], 'achievements': []
+    }
+    seen = {key: set() for key, value in merged.items() if isinstance(value, list)}
+    
+    for result in results:
+        if not isinstance(result, dict):
+            continue
+        for field, value in (result.get('personal') or {}).items():
+            if value and not merged['personal'].get(field):
+                merged['personal'][field] = value
+        if result.get('summary') and not merged['summary']:
+            merged['summary'] = result['summary']
+        for key in seen:
+            for item in result.get(key) or []:
+                # Overlapping chunks return the same entries twice
+                identity = _entry_identity(key, item)
+                if identity not in seen[key]:
+                    seen[key].add(identity)
+                    merged[key].append(item)
+    
+    return merged
+
+
+def _analyze_with_llm(extracted_data: dict, job_role: str, job_desc: str) -> dict:
+    """Score and suggest using Gemini (FALLBACK)"""
+    
+    job_desc = (job_desc or "")[:500]
+    resume_json = orjson.dumps(extracted_data, option=orjson.OPT_SORT_KEYS).decode()
+    
+    request_data = f"""INPUT:
+- Target Job Role: {job_role}
+- Resume: {resume_json}
+- Job Desc: {job_desc if job_desc else "Not provided"}"""
+    
+    # Key the response cache on canonicalized inputs so re-submissions that differ only in case,
+    # spacing or key order are answered from it; the prompt keeps the original text ("Go" vs "go")
+    cache_key = make_cache_key(
+        'analyze', ANALYZE_SYSTEM_PROMPT, resume_json,
+        normalize_whitespace(job_role).lower(), normalize_whitespace(job_desc).lower()
     )
+    return _generate_json('analyze', ANALYZE_SYSTEM_PROMPT, request_data, cache_key=cache_key)
+
+# we can further break down enhancement into multiple steps if needed, but for simplicity we will do it in one step here. 
+# The prompt can be made more detailed to ensure better results.
+def _apply_changes_with_llm(original_data: dict, suggestions: list, job_role: str, job_desc: str) -> dict:
+    """
+    Apply changes using Gemini (FALLBACK)
+    All accepted suggestions are batched into this one request - never call it per suggestion
+    """
+    
+    # Send only the sections the suggestions touch (plus personal) as compact JSON;
+    # unknown section names fall back to sending the whole resume
+    touched_sections = {suggestion.get('section') for suggestion in suggestions if isinstance(suggestion, dict)}
+    if touched_sections <= set(RESUME_SECTIONS):
+        sections = touched_sections | {'personal'}
+        projected = {key: original_data[key] for key in RESUME_SECTIONS if key in sections and key in original_data}
+    else:
+        projected = original_data
+    
+    request_data = f"""INPUT:
+- Original Resume Data: {orjson.dumps(projected).decode()}
+- Accepted Suggestions: {orjson.dumps(suggestions).decode()}
+- Job Role: {job_role}
+- Job Description: {job_desc if job_desc else "Not provided"}"""
     
-    if not has_content:
-        return False
+    enhanced = _generate_json('apply_changes', APPLY_SYSTEM_PROMPT, request_data)
+    if not isinstance(enhanced, dict):
+        raise ValueError(f"Expected a JSON object of resume sections from the LLM, got {type(enhanced).__name__}")
     
-    return True
\ No newline at end of file
+    # Merge the enhanced sections back over the untouched ones
+    return {**original_data, **enhanced}
+
+
+# VALIDATION HELPERS
+
+def _validate_parsed_data(data: dict) -> bool:
+    """Validate that parsed data has minimum required fields"""
+    is_valid, _ = validate(data, strict=False)
+    return is_valid
@@ -3,11 +3,105 @@ Resume Generator Service
 Creates ATS-friendly DOCX resumes from structured data
 """
 
+from functools import lru_cache
+from io import BytesIO
+
 from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import OxmlElement
 from docx.shared import Pt, Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
+from app.services.validation import validate
+
+# Lengths used by the template, converted to EMUs once
+SZ_10, SZ_11, SZ_12, SZ_16 = Pt(10), Pt(11), Pt(12), Pt(16)
+MARGIN_VERTICAL, MARGIN_HORIZONTAL = Inches(0.5), Inches(0.7)
+
+# Paragraph styles baked into the template: name -> (base style, font size, bold, italic, centered)
+ATS_STYLES = {
+    'ATSName': ('Normal', SZ_16, True, False, True),
+    'ATSContact': ('Normal', SZ_10, False, False, True),
+    'ATSHeading': ('Normal', SZ_12, True, False, False),
+    'ATSTitle': ('Normal', SZ_11, True, False, False),
+    'ATSDetail': ('Normal', SZ_10, False, True, False),
+    'ATSBody': ('Normal', SZ_10, False, False, False),
+    'ATSBullet': ('List Bullet', SZ_10, False, False, False),
+}
+
+
+@lru_cache(maxsize=1)
+def _template_bytes() -> bytes:
+    """
+    Build the blank resume template once: ATS-friendly margins plus the ATS_STYLES paragraph styles
+    
+    Returns:
+        Saved DOCX bytes; every resume is generated from a copy of it
+    """
+    doc = Document()
+    
+    # Set narrow margins which is ATS Friendly
+    for section in doc.sections:
+        section.top_margin = MARGIN_VERTICAL
+        section.bottom_margin = MARGIN_VERTICAL
+        section.left_margin = MARGIN_HORIZONTAL
+        section.right_margin = MARGIN_HORIZONTAL
+    
+    for name, (base, size, bold, italic, centered) in ATS_STYLES.items():
+        style = doc.styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+        style.base_style = doc.styles[base]
+        style.font.size = size
+        if bold:
+            style.font.bold = True
+        if italic:
+            style.font.italic = True
+        if centered:
+            style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def _p(text: str = None, style_id: str = None):
+    """
+    Build a <w:p> element without going through the python-docx proxy objects
+    
+    Args:
+        text: Run text (tabs/newlines handled as in Paragraph.add_run)
+        style_id: Paragraph style id, e.g. 'ATSBody'; formatting comes from the style, not the run
+        
+    Returns:
+        Paragraph element ready to append to the document body
+    """
+    p = OxmlElement('w:p')
+    if style_id:
+        p.get_or_add_pPr().style = style_id
+    
+    if text:
+        p.add_r().text = text
+    return p
+
+
+def _append_paragraphs(doc, paragraphs: list):
+    """
+    Append built paragraphs to the document body in one pass, keeping sectPr last
+    
+    Args:
+        doc: Document object
+        paragraphs: <w:p> elements
+    """
+    body = doc.element.body
+    sectPr = body.sectPr
+    if sectPr is not None:
+        body.remove(sectPr)
+    body.extend(paragraphs)
+    if sectPr is not None:
+        body.append(sectPr)
+
+
 # This module takes structured resume data (as a dictionary) and generates a well-formatted DOCX resume.
+# Paragraphs are built as XML elements and appended to the body in one batch.
 def generate_ats_resume(data: dict, filename: str):
     """
     Generate ATS-friendly DOCX resume
@@ -16,24 +110,14 @@ def generate_ats_resume(data: dict, filename: str):
         data: Structured resume data
         filename: Output file path
     """
-    doc = Document()
+    doc = Document(BytesIO(_template_bytes()))
     
-    # Set narrow margins which is ATS Friendly
-    sections = doc.sections
-    for section in sections:
-        section.top_margin = Inches(0.5)
-        section.bottom_margin = Inches(0.5)
-        section.left_margin = Inches(0.7)
-        section.right_margin = Inches(0.7)
+    paragraphs = []
+    add = paragraphs.append
     
     # HEADER - Name and Contact
     personal = data.get('personal', {})
-    name = doc.add_paragraph()
-    name_run = name.add_run(personal.get('name', 'Your Name'))
-    name_run.font.size = Pt(16)
-    name_run.font.bold = True
-    name.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    contact = doc.add_paragraph()
+    add(_p(personal.get('name', 'Your Name'), 'ATSName'))
     contact_parts = []
     
     if personal.get('email'):
@@ -46,97 +130,69 @@ def generate_ats_resume(data: dict, filename: str):
         contact_parts.append(personal['location'])
     
     contact_text = ' | '.join(contact_parts)
-    contact.add_run(contact_text)
-    contact.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    contact.runs[0].font.size = Pt(10)
+    add(_p(contact_text, 'ATSContact'))
     
     # For spacing between header and next section
-    doc.add_paragraph()
+    add(_p())
     
     # PROFESSIONAL SUMMARY, TECHNICAL SKILLS and EXPERIENCE
     if data.get('summary'):
-        add_section(doc, 'PROFESSIONAL SUMMARY', data['summary'])
+        paragraphs.extend(_section_paragraphs('PROFESSIONAL SUMMARY', data['summary']))
     
-    if data.get('skills'):
-        skills_text = ' • '.join(data['skills'])
-        add_section(doc, 'TECHNICAL SKILLS', skills_text)
+    skills = _unique_items(data.get('skills'))
+    if skills:
+        skills_text = ' • '.join(skills)
+        paragraphs.extend(_section_paragraphs('TECHNICAL SKILLS', skills_text))
 
     if data.get('experience'):
-        heading = doc.add_paragraph()
-        heading_run = heading.add_run('EXPERIENCE')
-        heading_run.font.size = Pt(12)
-        heading_run.font.bold = True
+        add(_p('EXPERIENCE', 'ATSHeading'))
         
         for exp in data['experience']:
             # Job Title and Company
-            exp_header = doc.add_paragraph()
             title_company = f"{exp.get('title', '')} | {exp.get('company', '')}"
-            title_run = exp_header.add_run(title_company)
-            title_run.bold = True
-            title_run.font.size = Pt(11)
+            add(_p(title_company, 'ATSTitle'))
             
             # Duration
             if exp.get('duration'):
-                duration_para = doc.add_paragraph()
-                duration_run = duration_para.add_run(exp.get('duration', ''))
-                duration_run.italic = True
-                duration_run.font.size = Pt(10)
+                add(_p(exp.get('duration', ''), 'ATSDetail'))
             
             # Bullet points
             for point in exp.get('points', []):
-                p = doc.add_paragraph(point, style='List Bullet')
-                p.runs[0].font.size = Pt(10)
-            doc.add_paragraph()
+                add(_p(point, 'ATSBullet'))
+            add(_p())
     
     # PROJECTS 
     if data.get('projects'):
-        heading = doc.add_paragraph()
-        heading_run = heading.add_run('PROJECTS')
-        heading_run.font.size = Pt(12)
-        heading_run.font.bold = True
+        add(_p('PROJECTS', 'ATSHeading'))
         
         for proj in data['projects']:
             # Project Name
-            proj_header = doc.add_paragraph()
-            proj_name_run = proj_header.add_run(proj.get('name', ''))
-            proj_name_run.bold = True
-            proj_name_run.font.size = Pt(11)
+            add(_p(proj.get('name', ''), 'ATSTitle'))
             
             # Technologies
             if proj.get('tech'):
-                tech_para = doc.add_paragraph()
                 tech_text = f"Technologies: {', '.join(proj['tech'])}"
-                tech_run = tech_para.add_run(tech_text)
-                tech_run.italic = True
-                tech_run.font.size = Pt(10)
+                add(_p(tech_text, 'ATSDetail'))
             
             # Description
             if proj.get('description'):
-                desc_para = doc.add_paragraph(proj['description'])
-                desc_para.runs[0].font.size = Pt(10)
+                add(_p(proj['description'], 'ATSBody'))
             
             # Bullet points
             for point in proj.get('points', []):
-                p = doc.add_paragraph(point, style='List Bullet')
-                p.runs[0].font.size = Pt(10)
+                add(_p(point, 'ATSBullet'))
             
             # Add spacing between projects
-            doc.add_paragraph()
+            add(_p())
     
     # EDUCATION
     if data.get('education'):
-        heading = doc.add_paragraph()
-        heading_run = heading.add_run('EDUCATION')
-        heading_run.font.size = Pt(12)
-        heading_run.font.bold = True
+        add(_p('EDUCATION', 'ATSHeading'))
         
         for edu in data['education']:
             # Degree and Institution
-            edu_p = doc.add_paragraph()
             degree_inst = f"{edu.get('degree', '')} | {edu.get('institution', '')}"
-            degree_run = edu_p.add_run(degree_inst)
-            degree_run.bold = True
-            degree_run.font.size = Pt(11)
+            add(_p(degree_inst, 'ATSTitle'))
             
             # Year and GPA
             details = []
@@ -146,29 +202,68 @@ def generate_ats_resume(data: dict, filename: str):
                 details.append(f"GPA: {edu['gpa']}")
             
             if details:
-                detail_para = doc.add_paragraph(' | '.join(details))
-                detail_para.runs[0].font.size = Pt(10)
+                add(_p(' | '.join(details), 'ATSBody'))
             
             # Add spacing
-            doc.add_paragraph()
+            add(_p())
     
     # CERTIFICATIONS and ACHIEVEMENTS
-    if data.get('certifications'):
-        cert_text = ' • '.join(data['certifications'])
-        add_section(doc, 'CERTIFICATIONS', cert_text)
+    certifications = _unique_items(data.get('certifications'))
+    if certifications:
+        cert_text = ' • '.join(certifications)
+        paragraphs.extend(_section_paragraphs('CERTIFICATIONS', cert_text))
 
-    if data.get('achievements'):
-        heading = doc.add_paragraph()
-        heading_run = heading.add_run('ACHIEVEMENTS')
-        heading_run.font.size = Pt(12)
-        heading_run.font.bold = True
+    achievements = _unique_items(data.get('achievements'))
+    if achievements:
+        add(_p('ACHIEVEMENTS', 'ATSHeading'))
         
-        for achievement in data['achievements']:
-            p = doc.add_paragraph(achievement, style='List Bullet')
-            p.runs[0].font.size = Pt(10)
+        for achievement in achievements:
+            add(_p(achievement, 'ATSBullet'))
+    
+    _append_paragraphs(doc, paragraphs)
+    
+    # Save document: serialise the zip in memory, then write it in one call
+    # (a failed save no longer leaves a truncated file behind)
+    buffer = BytesIO()
+    doc.save(buffer)
+    with open(filename, 'wb') as f:
+        f.write(buffer.getbuffer())
+
+
+def _unique_items(items: list) -> tuple:
+    """
+    Strip list entries and drop blanks and case-insensitive duplicates (first spelling wins)
+    
+    Args:
+        items: Skills, certifications or achievements (may be None)
+        
+    Returns:
+        Tuple of unique entries in original order
+    """
+    unique = {}
+    for item in items or ():
+        item = item.strip()
+        if item:
+            unique.setdefault(item.lower(), item)
+    return tuple(unique.values())
+
+
+def _section_paragraphs(title: str, content: str) -> list:
+    """
+    Build heading, content and spacing paragraphs for a simple section
     
-    # Save document
-    doc.save(filename)
+    Args:
+        title: Section title
+        content: Section content
+        
+    Returns:
+        List of <w:p> elements
+    """
+    return [
+        _p(title, 'ATSHeading'),
+        _p(content, 'ATSBody'),
+        _p(),
+    ]
 
 
 def add_section(doc, title: str, content: str):
@@ -180,18 +275,7 @@ def add_section(doc, title: str, content: str):
         title: Section title
         content: Section content
     """
-    # Heading
-    heading = doc.add_paragraph()
-    heading_run = heading.add_run(title)
-    heading_run.font.size = Pt(12)
-    heading_run.font.bold = True
-    
-    # Content
-    para = doc.add_paragraph(content)
-    para.runs[0].font.size = Pt(10)
-    
-    # Add spacing
-    doc.add_paragraph()
+    _append_paragraphs(doc, _section_paragraphs(title, content))
 
 
 def generate_resume_with_template(data: dict, filename: str, template: str = "modern"):
@@ -218,35 +302,7 @@ def validate_resume_data(data: dict) -> tuple[bool, list]:
     Returns:
         Tuple of (is_valid, errors)
     """
-    errors = []
-    
-    # Check required top-level keys
-    required_keys = ['personal', 'skills', 'experience', 'education']
-    for key in required_keys:
-        if key not in data:
-            errors.append(f"Missing required section: {key}")
-    
-    # Check personal information
-    if 'personal' in data:
-        personal = data['personal']
-        if not personal.get('name'):
-            errors.append("Name is required in personal section")
-        if not personal.get('email'):
-            errors.append("Email is recommended in personal section")
-    
-    # Check if at least one content section has data
-    has_content = (
-        len(data.get('skills', [])) > 0 or
-        len(data.get('experience', [])) > 0 or
-        len(data.get('education', [])) > 0 or
-        data.get('summary', '').strip() != ''
-    )
-    
-    if not has_content:
-        errors.append("Resume must have at least one content section with data")
-    
-    is_valid = len(errors) == 0
-    return is_valid, errors
+    return validate(data)
 
 
 def get_resume_statistics(data: dict) -> dict:
@@ -1,22 +1,34 @@
 import pdfplumber
 import docx
+from docx.oxml.ns import qn
 import os
 import re
+from functools import lru_cache
+from io import BytesIO
+from typing import BinaryIO, Optional, Union
 
-def extract_text_from_file(file_path: str) -> str:
+def extract_text_from_file(file_path: Union[str, bytes, BinaryIO], filename: Optional[str] = None) -> str:
     """
     Extract text from PDF or DOCX file
 
     Args:
-        file_path: Path to the file
+        file_path: Path to the file, or the file contents as bytes / a binary stream
+        filename: Original filename, used to detect the file type for in-memory input
 
     Returns:
         Extracted text as string
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
+    if isinstance(file_path, str):
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        filename = filename or file_path
+    elif isinstance(file_path, (bytes, bytearray)):
+        file_path = BytesIO(file_path)
 
-    file_extension = file_path.lower().split('.')[-1]
+    if not filename:
+        raise ValueError("filename is required to detect the type of in-memory files")
+
+    file_extension = filename.lower().split('.')[-1]
 
     if file_extension == 'pdf':
         text = extract_text_from_pdf(file_path)
@@ -30,28 +42,109 @@ def extract_text_from_file(file_path: str) -> str:
 
     return text
 
-def extract_text_from_pdf(file_path: str) -> str:
+def extract_text_from_pdf(file_path: Union[str, BinaryIO]) -> str:
     """
-    Extract text from PDF file using pdfplumber
+    Extract text from PDF file (path or binary stream) using pdfplumber
     """
     with pdfplumber.open(file_path) as pdf:
-        text = ""
+        parts = []
         for page in pdf.pages:
             page_text = page.extract_text()
             if page_text:
-                text += page_text + "\n"
-        return text.strip()
+                parts.append(page_text)
+            # pdf.pages keeps every Page alive; drop its parsed layout/objects once its text is taken
+            # so memory stays flat on long documents
+            page.flush_cache()
+        return "\n".join(parts).strip()
 
-def extract_text_from_docx(file_path: str) -> str:
+def extract_text_from_docx(file_path: Union[str, BinaryIO]) -> str:
     """
-    Extract text from DOCX file using python-docx
+    Extract text from DOCX file (path or binary stream) using python-docx
     """
     doc = docx.Document(file_path)
-    text = ""
-    for paragraph in doc.paragraphs:
-        text += paragraph.text + "\n"
-    return text.strip()
-
+    # Read the body's <w:p> elements directly rather than building a Paragraph proxy for each
+    # (same paragraphs as doc.paragraphs; CT_P.text maps tabs/breaks exactly like Paragraph.text)
+    body = doc.element.body
+    return "\n".join(p.text for p in body.iterchildren(qn('w:p'))).strip()
+
+# Section detection patterns (matched against the lowercased line)
+SECTION_PATTERNS = [
+    r'^(professional\s+summary|summary|objective|profile|about\s+me)$',
+    r'^(work\s+experience|experience|employment|work\s+history|professional\s+experience)$',
+    r'^(education|academic|qualifications|educational\s+background)$',
+    r'^(skills|technical\s+skills|core\s+competencies|expertise|competencies)$',
+    r'^(projects|personal\s+projects|key\s+projects)$',
+    r'^(certifications?|licenses?|credentials)$',
+    r'^(achievements?|awards?|honors?|accomplishments)$',
+    r'^(languages?|technical\s+proficiencies)$',
+    r'^(interests?|hobbies)$',
+    r'^(references?|contact\s+information)$'
+]
+
+# Bullet markers to detect
+BULLET_MARKERS = ('•', '-', '–', '▪', '○', '●', '■', '♦')
+
+# Sections where bullets are allowed
+BULLET_ALLOWED_SECTIONS = ['EXPERIENCE', 'KEY PROJECTS', 'PROJECTS']
+
+# Lines are stripped before classification, so a bullet line simply starts with a marker
+# (line.startswith(BULLET_MARKERS)) and a standalone bullet is exactly one marker
+_BULLET_SET = frozenset(BULLET_MARKERS)
+
+# Compiled once at import instead of going through the re cache on every line
+# All section patterns fused into one alternation: a single match per line instead of up to ten
+_SECTION_RE = re.compile('^(?:' + '|'.join(pattern[1:-1] for pattern in SECTION_PATTERNS) + ')$')
+_ALLCAPS_HEADER_RE = re.compile(r'^[A-Z\s]{3,}$')
+# First letters of every heading in SECTION_PATTERNS; body lines starting with anything else skip the regex
+_SECTION_FIRST_CHARS = frozenset('acehiklopqrstw')
+_DATE_LOC_RE = re.compile(
+    r'^\d{1,2}/\d{4}\s*[-–]\s*\d{1,2}/\d{4}.*\|.*$|^\d{1,2}/\d{4}\s*[-–]\s*present.*\|.*$', re.IGNORECASE
+)
+_ROLE_RE = re.compile(r'^[^,]+,\s*[^,]+\s*\d{1,2}/\d{4}')
+
+# Punctuation that ends a sentence (a line ending in one is never merged with the next)
+SENTENCE_ENDINGS = ('.', '!', '?', ';')
+
+# Kind of the last line emitted by post_process_text, tracked as lines are appended so the
+# project-title context check doesn't have to re-classify processed_lines[-1]
+_KIND_TEXT, _KIND_TECH, _KIND_BLANK, _KIND_SECTION = range(4)
+# A project title follows a Tech: line, a blank line or a section header
+_TITLE_CONTEXT_KINDS = frozenset({_KIND_TECH, _KIND_BLANK, _KIND_SECTION})
+
+
+def _text_kind(line: str) -> int:
+    """Kind of a non-empty, non-header output line"""
+    return _KIND_TECH if line.startswith('Tech:') else _KIND_TEXT
+
+
+def _is_section_line(line_lower: str) -> bool:
+    """Section header check for a stripped, lowercased line (first-character gate before the regex)"""
+    return line_lower[:1] in _SECTION_FIRST_CHARS and _SECTION_RE.match(line_lower) is not None
+
+
+def _looks_like_project_title(line: str, line_lower: str, verb_re) -> bool:
+    """Title case, 3-12 words and no action verbs - cheapest checks first, istitle() last"""
+    return 3 <= len(line.split()) <= 12 and not verb_re.search(line_lower) and line.istitle()
+
+
+# Verbs that rule a line out as a project title. Matched as substrings (so "without" counts as
+# "with"), hence one alternation search instead of a per-word scan
+TITLE_VERBS = (
+    'developed', 'created', 'built', 'using', 'with', 'performed',
+    'completed', 'integrated', 'deployed', 'designed', 'produced'
+)
+PROJECT_TITLE_VERBS = TITLE_VERBS + ('analyzed', 'managed', 'led')
+_TITLE_VERB_RE = re.compile('|'.join(TITLE_VERBS))
+_PROJECT_TITLE_VERB_RE = re.compile('|'.join(PROJECT_TITLE_VERBS))
+
+# First words that mark a line as the continuation of the previous sentence
+CONTINUATION_WORDS = frozenset({
+    'and', 'or', 'but', 'the', 'a', 'an', 'in', 'on', 'at', 'to', 'for', 'with', 'by', 'from'
+})
+
+# Pure function of the text: re-uploads of the same resume (files that miss the extracted-text
+# cache, e.g. re-exported with new metadata but identical text) skip the line pass entirely
+@lru_cache(maxsize=64)
 def post_process_text(text: str) -> str:
     """
     Apply sophisticated post-processing to preserve layout semantics
@@ -63,50 +156,44 @@ def post_process_text(text: str) -> str:
     4. Project title detector: Convert bullet-prefixed titles to plain titles
     5. Summary protection: Disable aggressive merging in PROFESSIONAL SUMMARY
     """
-    lines = text.split('\n')
+    # Strip every line once up front; the main loop and lookaheads index into this list
+    lines = [raw.strip() for raw in text.split('\n')]
     processed_lines = []
 
-    # Section detection patterns (case-insensitive)
-    section_patterns = [
-        r'^(professional\s+summary|summary|objective|profile|about\s+me)$',
-        r'^(work\s+experience|experience|employment|work\s+history|professional\s+experience)$',
-        r'^(education|academic|qualifications|educational\s+background)$',
-        r'^(skills|technical\s+skills|core\s+competencies|expertise|competencies)$',
-        r'^(projects|personal\s+projects|key\s+projects)$',
-        r'^(certifications?|licenses?|credentials)$',
-        r'^(achievements?|awards?|honors?|accomplishments)$',
-        r'^(languages?|technical\s+proficiencies)$',
-        r'^(interests?|hobbies)$',
-        r'^(references?|contact\s+information)$'
-    ]
-
-    # Bullet markers to detect
-    bullet_markers = [r'•', r'-', r'–', r'▪', r'○', r'●', r'■', r'♦']
-
-    # Sections where bullets are allowed
-    bullet_allowed_sections = ['EXPERIENCE', 'KEY PROJECTS', 'PROJECTS']
 
     i = 0
     current_section = None
     last_non_empty_line = None
     last_line_was_bullet = False
+    last_kind = None
+
+    n_lines = len(lines)
 
-    while i < len(lines):
-        line = lines[i].strip()
+    # next_nonblank[k] = index of the first non-empty line at or after k (n_lines if none),
+    # so orphan-bullet targets are found without rescanning runs of blank lines
+    next_nonblank = [n_lines] * (n_lines + 1)
+    for k in range(n_lines - 1, -1, -1):
+        next_nonblank[k] = k if lines[k] else next_nonblank[k + 1]
+
+    while i < n_lines:
+        line = lines[i]
 
         # Skip empty lines at the start
         if not line:
             i += 1
             continue
 
+        # Lowercased once per line; recomputed below wherever the line is rewritten
+        line_lower = line.lower()
+
         # HEADER DE-DUPLICATION GUARD
         # Check if this is a duplicate section header
         is_duplicate_header = False
-        for pattern in section_patterns:
-            if re.match(pattern, line.lower()):
-                if last_non_empty_line and last_non_empty_line.upper() == line.upper():
-                    is_duplicate_header = True
-                break
+        is_section_header = _is_section_line(line_lower)
+        if is_section_header:
+            line_upper = line.upper()
+            if last_non_empty_line and last_non_empty_line.upper() == line_upper:
+                is_duplicate_header = True
 
         if is_duplicate_header:
             i += 1
@@ -114,14 +201,12 @@ def post_process_text(text: str) -> str:
 
         # DETECT CURRENT SECTION
         section_detected = False
-        for pattern in section_patterns:
-            if re.match(pattern, line.lower()):
-                current_section = line.upper()
-                section_detected = True
-                break
+        if is_section_header:
+            current_section = line_upper
+            section_detected = True
 
         # Also check for all-caps lines (common section headers)
-        if not section_detected and re.match(r'^[A-Z\s]{3,}$', line) and len(line) > 3:
+        if not section_detected and line[0].isupper() and len(line) > 3 and _ALLCAPS_HEADER_RE.match(line):
             current_section = line.upper()
             section_detected = True
 
@@ -130,88 +215,68 @@ def post_process_text(text: str) -> str:
             if processed_lines:
                 processed_lines.append('')
             processed_lines.append(current_section)
+            last_kind = _KIND_SECTION
             last_non_empty_line = current_section
             i += 1
             continue
 
         # MID-SENTENCE BULLET SPLIT PROTECTION
         # To check if this line starts with bullet and should merge with next line
-        if any(line.startswith(marker) or re.match(rf'^\s*{re.escape(marker)}\s', line) for marker in bullet_markers):
-            next_line_check = lines[i + 1].strip() if i + 1 < len(lines) else ""
-            if next_line_check and not re.search(r'[.!?;]$', line) and next_line_check[0].islower():
+        # Lookahead shared by both merge checks; refreshed if the bullet merge consumes a line
+        next_line = lines[i + 1] if i + 1 < n_lines else ""
+        if line.startswith(BULLET_MARKERS):
+            if next_line and not line.endswith(SENTENCE_ENDINGS) and next_line[0].islower():
                 # Merge bullet line with next line before processing
-                line = line + " " + next_line_check
+                line = line + " " + next_line
+                line_lower = line.lower()
                 i += 1  # Skip the next line since we merged it
+                next_line = lines[i + 1] if i + 1 < n_lines else ""
 
         # BULLET + HEADER FIREWALL & SECTION-AWARE BULLET SCOPE
         # Check if this line contains ONLY a bullet symbol
-        is_standalone_bullet = False
-        for marker in bullet_markers:
-            if re.match(rf'^\s*{re.escape(marker)}\s*$', line):
-                is_standalone_bullet = True
-                break
+        is_standalone_bullet = line in _BULLET_SET
 
         if is_standalone_bullet:
             # Only process bullets if we're in an allowed section
-            if current_section and any(allowed in current_section for allowed in bullet_allowed_sections):
+            if current_section and any(allowed in current_section for allowed in BULLET_ALLOWED_SECTIONS):
                 # Find the next non-empty line and check if it's a valid target
                 bullet_marker = line.strip()
-                j = i + 1
+                j = next_nonblank[i + 1]
                 valid_target_found = False
-                while j < len(lines):
-                    next_line = lines[j].strip()
-                    if next_line:
-                        # SO that we never attach to section headers or ALL CAPS lines
-                        is_header_target = (
-                            next_line.isupper() or
-                            any(re.match(pattern, next_line.lower()) for pattern in section_patterns)
+                if j < n_lines:
+                    next_line = lines[j]
+                    next_line_lower = next_line.lower()
+                    # SO that we never attach to section headers or ALL CAPS lines
+                    is_header_target = (
+                        next_line.isupper() or
+                        _is_section_line(next_line_lower)
+                    )
+
+                    if not is_header_target:
+                        # PROJECT TITLE DETECTION
+                        # A line is a project title if:
+                        # - No verbs (developed, created, built, using, with)
+                        # - Title case
+                        # - Reasonable length
+                        # - Appears after "Tech:" line or blank line
+                        # Check context first: after Tech: or blank line or section header
+                        is_project_title = (
+                            last_kind in _TITLE_CONTEXT_KINDS and
+                            _looks_like_project_title(next_line, next_line_lower, _TITLE_VERB_RE)
                         )
 
-                        if not is_header_target:
-                            # PROJECT TITLE DETECTION
-                            # A line is a project title if:
-                            # - No verbs (developed, created, built, using, with)
-                            # - Title case
-                            # - Reasonable length
-                            # - Appears after "Tech:" line or blank line
-                            has_verbs = any(word in next_line.lower() for word in [
-                                'developed', 'created', 'built', 'using', 'with', 'performed',
-                                'completed', 'integrated', 'deployed', 'designed', 'produced'
-                            ])
-                            is_title_case = next_line.istitle()
-                            reasonable_length = 3 <= len(next_line.split()) <= 12
-
-                            # Check context: after Tech: or blank line or section header
-                            prev_was_tech = False
-                            prev_was_blank = False
-                            prev_was_section = False
-                            if processed_lines:
-                                last_processed = processed_lines[-1]
-                                prev_was_tech = last_processed.startswith('Tech:')
-                                prev_was_blank = last_processed == ''
-                                prev_was_section = any(re.match(pattern, last_processed.upper()) for pattern in section_patterns)
-
-                            is_project_title = (
-                                not has_verbs and
-                                is_title_case and
-                                reasonable_length and
-                                (prev_was_tech or prev_was_blank or prev_was_section)
-                            )
-
-                            if is_project_title:
-                                # Convert to plain title (remove bullet)
-                                processed_lines.append(next_line)
-                            else:
-                                # Normal bullet attachment
-                                merged_bullet = f"{bullet_marker} {next_line}"
-                                processed_lines.append(merged_bullet)
-                            valid_target_found = True
-                            i = j + 1  # Skip the line we just processed
-                            break
+                        if is_project_title:
+                            # Convert to plain title (remove bullet)
+                            processed_lines.append(next_line)
+                            last_kind = _text_kind(next_line)
                         else:
-                            # Invalid target, stop looking
-                            break
-                    j += 1
+                            # Normal bullet attachment
+                            merged_bullet = f"{bullet_marker} {next_line}"
+                            processed_lines.append(merged_bullet)
+                            last_kind = _KIND_TEXT
+                        valid_target_found = True
+                        i = j + 1  # Skip the line we just processed
+                    # Otherwise the target is a header: stop looking and drop the bullet
 
                 # TRAILING ORPHAN BULLETS 
                 # If no valid target found, discard the bullet entirely
@@ -226,17 +291,16 @@ def post_process_text(text: str) -> str:
         # PRE-BULLET SENTENCE MERGING 
         # To check if we should merge with next line BEFORE processing bullets
         should_merge = False
-        next_line = lines[i + 1].strip() if i + 1 < len(lines) else ""
 
         if next_line:
             # Conditions for merging (applied before bullet processing):
-            ends_with_sentence = re.search(r'[.!?;]$', line)
-            next_starts_lowercase = next_line[0].islower() if next_line else False
-            continuation_words = ['and', 'or', 'but', 'the', 'a', 'an', 'in', 'on', 'at', 'to', 'for', 'with', 'by', 'from']
-            next_is_continuation = next_line.lower().split()[0] in continuation_words if next_line else False
+            ends_with_sentence = line.endswith(SENTENCE_ENDINGS)
+            next_starts_lowercase = next_line[0].islower()
+            next_line_lower = next_line.lower()
+            next_is_continuation = next_line_lower.split(None, 1)[0] in CONTINUATION_WORDS
 
             # Don't merge if next line is a section header
-            next_is_section = any(re.match(pattern, next_line.lower()) for pattern in section_patterns)
+            next_is_section = _is_section_line(next_line_lower)
 
             # Special handling for CERTIFICATIONS section
             if current_section and 'CERTIFICATION' in current_section:
@@ -250,6 +314,7 @@ def post_process_text(text: str) -> str:
             # Merge with next line
             merged_line = line + " " + next_line
             processed_lines.append(merged_line)
+            last_kind = _text_kind(merged_line)
             last_non_empty_line = merged_line
             last_line_was_bullet = False  # Reset bullet tracking after merge
             i += 2
@@ -257,82 +322,68 @@ def post_process_text(text: str) -> str:
 
         # PROJECT TITLE DETECTION 
         # Check if this line is a project title that should not get a bullet
-        is_project_title = False
-        if (current_section and 'PROJECTS' in current_section and
-            not any(word in line.lower() for word in [
-                'developed', 'created', 'built', 'using', 'with', 'performed',
-                'completed', 'integrated', 'deployed', 'designed', 'produced',
-                'built', 'using', 'with', 'performed', 'completed', 'integrated',
-                'deployed', 'designed', 'produced', 'analyzed', 'managed', 'led'
-            ]) and
-            line.istitle() and
-            3 <= len(line.split()) <= 12):
-            # Check context: after Tech: or blank line or section header
-            prev_was_tech = False
-            prev_was_blank = False
-            prev_was_section = False
-            if processed_lines:
-                last_processed = processed_lines[-1]
-                prev_was_tech = last_processed.startswith('Tech:')
-                prev_was_blank = last_processed == ''
-                prev_was_section = any(re.match(pattern, last_processed.upper()) for pattern in section_patterns)
-
-            is_project_title = prev_was_tech or prev_was_blank or prev_was_section
+        # Context (after Tech: or blank line or section header) is checked before the line itself
+        is_project_title = bool(
+            current_section and 'PROJECTS' in current_section and
+            last_kind in _TITLE_CONTEXT_KINDS and
+            _looks_like_project_title(line, line_lower, _PROJECT_TITLE_VERB_RE)
+        )
 
         # BULLET INHERITANCE FOR CONTINUATION LINES
         # If the last processed line was a bullet and this line is a continuation, prefix with bullet
         if (not is_project_title and
             processed_lines and processed_lines[-1].startswith('• ') and
-            current_section and any(allowed in current_section for allowed in bullet_allowed_sections) and
+            current_section and any(allowed in current_section for allowed in BULLET_ALLOWED_SECTIONS) and
             not line.isupper() and  # Not a section header
-            not any(re.match(pattern, line.lower()) for pattern in section_patterns) and  # Not a section header
+            not _is_section_line(line_lower) and  # Not a section header
             not line.startswith('• ') and  # Not already a bullet
-            not any(line.startswith(marker) for marker in bullet_markers)):  # Not a bullet
+            not line.startswith(BULLET_MARKERS)):  # Not a bullet
             line = f"• {line}"
 
         # Check if current line starts with bullet 
         is_bullet_line = False
-        for marker in bullet_markers:
-            if line.startswith(marker) or re.match(rf'^\s*{re.escape(marker)}\s', line):
-                is_bullet_line = True
-                # Only normalize if in allowed section
-                if current_section and any(allowed in current_section for allowed in bullet_allowed_sections):
-                    line = re.sub(rf'^\s*{re.escape(marker)}\s*', '• ', line)
-
-                    # TECH: LINES ARE NEVER BULLETS
-                    # Strip bullet marker from Tech: lines
-                    if line.startswith('• Tech:'):
-                        line = line[2:]  # Remove the "• " prefix
-                        is_bullet_line = False  # Mark as not a bullet
-                else:
-                    # Remove bullet marker entirely
-                    line = re.sub(rf'^\s*{re.escape(marker)}\s*', '', line)
-                    is_bullet_line = False
-                break
+        if line.startswith(BULLET_MARKERS):
+            # The marker is line[0]; drop it and the whitespace after it (no regex needed)
+            bullet_text = line[1:].lstrip()
+            is_bullet_line = True
+            # Only normalize if in allowed section
+            if current_section and any(allowed in current_section for allowed in BULLET_ALLOWED_SECTIONS):
+                line = '• ' + bullet_text
+
+                # TECH: LINES ARE NEVER BULLETS
+                # Strip bullet marker from Tech: lines
+                if line.startswith('• Tech:'):
+                    line = line[2:]  # Remove the "• " prefix
+                    is_bullet_line = False  # Mark as not a bullet
+            else:
+                # Remove bullet marker entirely
+                line = bullet_text
+                is_bullet_line = False
 
         # Update bullet tracking
         last_line_was_bullet = is_bullet_line
 
         # ANCHOR DATES AND LOCATIONS
-        date_location_pattern = r'^\d{1,2}/\d{4}\s*[-–]\s*\d{1,2}/\d{4}.*\|.*$|^\d{1,2}/\d{4}\s*[-–]\s*present.*\|.*$'
-        if re.match(date_location_pattern, line, re.IGNORECASE):
+        if _DATE_LOC_RE.match(line):
             processed_lines.append(line)
+            last_kind = _text_kind(line)
             last_non_empty_line = line
             i += 1
             continue
 
         # ENFORCE SECTION BOUNDARIES
-        role_pattern = r'^[^,]+,\s*[^,]+\s*\d{1,2}/\d{4}'
-        if re.match(role_pattern, line):
+        if _ROLE_RE.match(line):
             if processed_lines and processed_lines[-1]:
                 processed_lines.append('')
             processed_lines.append(line)
+            last_kind = _text_kind(line)
             last_non_empty_line = line
             i += 1
             continue
 
         # Default: add the line as-is
         processed_lines.append(line)
+        last_kind = _text_kind(line)
         last_non_empty_line = line
         i += 1
 
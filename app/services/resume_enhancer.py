@@ -2,36 +2,59 @@ import re
 import copy
 from typing import Dict, List
 
+_HAS_DIGIT = re.compile(r'\d').search
+
+# Suggestion text parsing patterns, compiled once
+_SPLIT_ITEMS_RE = re.compile(r'[,;]|\sand\s')
+_ITEM_PREFIX_RE = re.compile(r'^(add|include|these|keywords?|skills?)\s+', re.IGNORECASE)
+# Cheap startswith() gate so the prefix regex only runs on items that can match it
+_ITEM_PREFIX_WORDS = ('add', 'include', 'these', 'keyword', 'skill')
+_QUOTED_RE = re.compile(r"['\"](.+?)['\"]")
+_HAS_ALPHA_RE = re.compile(r'[a-z]', re.IGNORECASE)
+# Surrounding punctuation/quotes trimmed from extracted items and summaries
+_STRIP_CHARS = ' ."\''
+
 
 class ResumeEnhancer:
     """Apply suggestions to resume data using rule-based transformations"""
     
     def __init__(self, original_data: Dict, suggestions: List[Dict], job_role: str, job_desc: str):
-        self.original_data = copy.deepcopy(original_data)
-        self.enhanced_data = copy.deepcopy(original_data)
+        self.original_data = original_data  # Shared reference - never modified
+        # Shallow copy; sections are deep-copied on first access through _section() (copy-on-write)
+        self.enhanced_data = dict(original_data)
+        self._copied_sections = set()
         self.suggestions = suggestions
         self.job_role = job_role
         self.job_desc = job_desc
     
+    def _section(self, key: str, default):
+        """Get a section of enhanced_data for modification, copying it from the original on first access"""
+        if key not in self._copied_sections:
+            self._copied_sections.add(key)
+            if key in self.enhanced_data:
+                self.enhanced_data[key] = copy.deepcopy(self.enhanced_data[key])
+        return self.enhanced_data.get(key, default)
+    
     def apply_changes(self) -> Dict:
         """Apply all accepted suggestions to resume data"""
         
         for suggestion in self.suggestions:
             section = suggestion.get('section', '')
             change = suggestion.get('change', '')
+            change_lower = change.lower()  # Keyword checks below all work on the lowercased text
             
             if section == 'skills':
                 self._apply_skills_change(change)
             elif section == 'summary':
                 self._apply_summary_change(change)
             elif section == 'experience':
-                self._apply_experience_change(change)
+                self._apply_experience_change(change_lower)
             elif section == 'personal':
-                self._apply_personal_change(change)
+                self._apply_personal_change(change_lower)
             elif section == 'education':
-                self._apply_education_change(change)
+                self._apply_education_change(change_lower)
             elif section == 'projects':
-                self._apply_projects_change(change)
+                self._apply_projects_change(change_lower)
         
         return self.enhanced_data
     
@@ -42,13 +65,15 @@ class ResumeEnhancer:
         skills_to_add = self._extract_items_from_text(change)
         
         if skills_to_add:
-            current_skills = self.enhanced_data.get('skills', [])
-            current_skills_lower = [s.lower() for s in current_skills]
+            current_skills = self._section('skills', [])
+            current_skills_lower = {s.lower() for s in current_skills}
             
-            # Add new skills (avoid duplicates)
+            # Add new skills (avoid duplicates, including repeats within this suggestion)
             for skill in skills_to_add:
-                if skill.lower() not in current_skills_lower:
+                skill_lower = skill.lower()
+                if skill_lower not in current_skills_lower:
                     current_skills.append(skill.title())
+                    current_skills_lower.add(skill_lower)
             
             self.enhanced_data['skills'] = current_skills
     
@@ -64,45 +89,45 @@ class ResumeEnhancer:
             # Generate default summary if none extracted
             self.enhanced_data['summary'] = self._generate_default_summary()
     
-    def _apply_experience_change(self, change: str):
-        """Apply changes to experience section"""
-        experiences = self.enhanced_data.get('experience', [])
+    def _apply_experience_change(self, change_lower: str):
+        """Apply changes to experience section (change text already lowercased)"""
+        experiences = self._section('experience', [])
         
         # Check if it's about adding quantifiable achievements
-        if 'quantifiable' in change.lower() or 'metrics' in change.lower():
+        if 'quantifiable' in change_lower or 'metrics' in change_lower:
             self._add_quantifiable_metrics(experiences)
         
         # Check if it's about expanding bullet points
-        elif 'expand' in change.lower() or 'bullet points' in change.lower():
+        elif 'expand' in change_lower or 'bullet points' in change_lower:
             self._expand_experience_bullets(experiences)
         
         # Check if it's about adding new experience
-        elif 'add' in change.lower() and ('work experience' in change.lower() or 'internship' in change.lower()):
+        elif 'add' in change_lower and ('work experience' in change_lower or 'internship' in change_lower):
             # Can't add experience without data, just ensure structure is present
             if not experiences:
                 self.enhanced_data['experience'] = []
         
         self.enhanced_data['experience'] = experiences
     
-    def _apply_personal_change(self, change: str):
-        """Apply changes to personal information section"""
-        personal = self.enhanced_data.get('personal', {})
+    def _apply_personal_change(self, change_lower: str):
+        """Apply changes to personal information section (change text already lowercased)"""
+        personal = self._section('personal', {})
         
         # Extract what needs to be added
-        if 'email' in change.lower() and not personal.get('email'):
+        if 'email' in change_lower and not personal.get('email'):
             personal['email'] = '[Your Email]'
-        if 'phone' in change.lower() and not personal.get('phone'):
+        if 'phone' in change_lower and not personal.get('phone'):
             personal['phone'] = '[Your Phone]'
-        if 'linkedin' in change.lower() and not personal.get('linkedin'):
+        if 'linkedin' in change_lower and not personal.get('linkedin'):
             personal['linkedin'] = '[Your LinkedIn]'
         
         self.enhanced_data['personal'] = personal
     
-    def _apply_education_change(self, change: str):
-        """Apply changes to education section"""
-        education = self.enhanced_data.get('education', [])
+    def _apply_education_change(self, change_lower: str):
+        """Apply changes to education section (change text already lowercased)"""
+        education = self._section('education', [])
         
-        if not education and 'add' in change.lower():
+        if not education and 'add' in change_lower:
             # Add placeholder for education
             education.append({
                 'degree': '[Your Degree]',
@@ -113,11 +138,11 @@ class ResumeEnhancer:
         
         self.enhanced_data['education'] = education
     
-    def _apply_projects_change(self, change: str):
-        """Apply changes to projects section"""
-        projects = self.enhanced_data.get('projects', [])
+    def _apply_projects_change(self, change_lower: str):
+        """Apply changes to projects section (change text already lowercased)"""
+        projects = self._section('projects', [])
         
-        if not projects and 'add' in change.lower():
+        if not projects and 'add' in change_lower:
             # Add placeholder for project
             projects.append({
                 'name': '[Project Name]',
@@ -139,17 +164,19 @@ class ResumeEnhancer:
                 text = parts[1]
         
         # Split by common delimiters
-        items = re.split(r'[,;]|\sand\s', text)
+        items = _SPLIT_ITEMS_RE.split(text)
         
         # Clean each item
         cleaned_items = []
         for item in items:
             # Remove common prefixes/suffixes and quotes
-            item = re.sub(r'^(add|include|these|keywords?|skills?)\s+', '', item.lower(), flags=re.IGNORECASE)
-            item = item.strip(' ."\'')
+            item = item.lower()
+            if item.startswith(_ITEM_PREFIX_WORDS):
+                item = _ITEM_PREFIX_RE.sub('', item, count=1)
+            item = item.strip(_STRIP_CHARS)
             
             # Keep only reasonable skill names (2-30 chars, alphanumeric with some special chars)
-            if 2 <= len(item) <= 30 and re.search(r'[a-z]', item, re.IGNORECASE):
+            if 2 <= len(item) <= 30 and _HAS_ALPHA_RE.search(item):
                 cleaned_items.append(item)
         
         return cleaned_items[:10]  # Max 10 items
@@ -157,7 +184,7 @@ class ResumeEnhancer:
     def _extract_quoted_text(self, text: str) -> str:
         """Extract text within quotes"""
         # Look for text in single or double quotes
-        match = re.search(r"['\"](.+?)['\"]", text)
+        match = _QUOTED_RE.search(text)
         if match:
             return match.group(1)
         
@@ -165,7 +192,7 @@ class ResumeEnhancer:
         if ':' in text:
             parts = text.split(':', 1)
             if len(parts) > 1:
-                return parts[1].strip(' ."\'')
+                return parts[1].strip(_STRIP_CHARS)
         
         return ""
     
@@ -199,16 +226,17 @@ class ResumeEnhancer:
             
             for point in points:
                 # If point already has numbers, keep it
-                if re.search(r'\d', point):
+                if _HAS_DIGIT(point):
                     enhanced_points.append(point)
                 else:
                     # Add suggestion for metric
                     # Try to identify action verbs and add metric suggestions
-                    if any(verb in point.lower() for verb in ['developed', 'created', 'built', 'designed']):
+                    point_lower = point.lower()
+                    if any(verb in point_lower for verb in ['developed', 'created', 'built', 'designed']):
                         enhanced_point = point.rstrip('.') + " [Add metric: e.g., reducing load time by 40%]"
-                    elif any(verb in point.lower() for verb in ['improved', 'optimized', 'enhanced']):
+                    elif any(verb in point_lower for verb in ['improved', 'optimized', 'enhanced']):
                         enhanced_point = point.rstrip('.') + " [Add metric: e.g., increasing efficiency by 30%]"
-                    elif any(verb in point.lower() for verb in ['led', 'managed', 'coordinated']):
+                    elif any(verb in point_lower for verb in ['led', 'managed', 'coordinated']):
                         enhanced_point = point.rstrip('.') + " [Add metric: e.g., leading a team of 5 developers]"
                     else:
                         enhanced_point = point
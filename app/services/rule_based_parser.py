@@ -1,13 +1,143 @@
 import re
-import spacy
 from typing import Dict, List
-from collections import Counter
 
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    nlp = None
-    print("spaCy model not found. Install with: python -m spacy download en_core_web_sm")
+
+# Additional comprehensive skill patterns
+# This list can be expanded with more specific tools, frameworks, and technologies relevant to the target job roles
+# This is used when skills are not mentioned in a dedicated skills section or not mentioned in a standard way and relying solely on patterns will miss many skills that are mentioned in experience/project descriptions
+# when not using API calls and totally relying on offline patterns will miss many skills that are mentioned in experience/project descriptions
+# Matched as plain substrings of the lowercased text
+EXTENDED_SKILLS = [
+    # Programming & Frameworks
+    'scikit-learn', 'xgboost', 'catboost', 'optuna', 'mlflow', 'langchain', 'fastapi',
+    'transformers', 'llms', 'gpt-4o-mini', 'neo4j', 'cypher', 'pinecone', 'asyncio',
+    'pytorch', 'tensorflow', 'keras', 'pandas', 'numpy', 'matplotlib', 'seaborn',
+    'jupyter', 'docker', 'kubernetes', 'jenkins', 'github actions', 'spark', 'hadoop',
+    'kafka', 'redis', 'mongodb', 'postgresql', 'mysql', 'sqlite',
+
+    # Cloud & DevOps
+    'aws s3', 'aws ec2', 'aws lambda', 'azure', 'gcp', 'heroku', 'vercel',
+
+    # ML/DL/NLP
+    'machine learning', 'deep learning', 'natural language processing', 'nlp',
+    'computer vision', 'reinforcement learning', 'supervised learning', 'unsupervised learning',
+    'regression', 'classification', 'clustering', 'dimensionality reduction', 'feature engineering',
+    'hyperparameter tuning', 'cross-validation', 'ensemble methods', 'neural networks',
+    'convolutional neural networks', 'recurrent neural networks', 'transformers',
+    'bert', 'gpt', 'rag', 'retrieval-augmented generation', 'vector embeddings',
+    'semantic search', 'knowledge graphs',
+
+    # Data Science
+    'data analysis', 'data visualization', 'eda', 'exploratory data analysis',
+    'statistical analysis', 'a/b testing', 'hypothesis testing', 'time series analysis',
+
+    # MLOps
+    'model deployment', 'model monitoring', 'model versioning', 'ci/cd', 'pipeline',
+    'experiment tracking', 'model registry', 'feature store',
+
+    # Other Technical
+    'api development', 'rest api', 'graphql', 'microservices', 'agile', 'scrum',
+    'git', 'version control', 'linux', 'bash', 'powershell'
+]
+
+
+# (skill, display name) pairs with the title-cased names built once at import rather than per hit;
+# plain `in` checks stay: CPython's substring search beats a single regex alternation sweep here
+_EXTENDED_SKILL_NAMES = tuple(
+    {skill: ' '.join(word.capitalize() for word in skill.split()) for skill in EXTENDED_SKILLS}.items()
+)
+
+# Compiled once at import instead of going through the re cache on every call
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+_LINKEDIN_RE = re.compile(r'linkedin\.com/in/[^\s]+', re.IGNORECASE)
+_DURATION_NUMERIC_RE = re.compile(r'\d{1,2}/\d{4}\s*[–-]\s*\d{1,2}/\d{4}')
+_DOUBLE_COMMA_RE = re.compile(r',\s*,')
+_GPA_RE = re.compile(r'GPA[:\s]*([\d.]+)', re.IGNORECASE)
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_INSTITUTION_DATE_RE = re.compile(r'\s*\d{1,2}/\d{4}.*')
+_INSTITUTION_PIPE_RE = re.compile(r'\s*\|\s*.*')
+_BULLET_MARKER_RE = re.compile(r'[•\-*]\s*')
+
+# Locations looked for near the top of the resume (substring match on the lowercased line)
+LOCATION_KEYWORDS = ('mumbai', 'delhi', 'pune', 'chennai', 'bangalore', 'hyderabad',
+                     'india', 'usa', 'uk', 'canada', 'australia')
+_LOCATION_RE = re.compile('|'.join(LOCATION_KEYWORDS))
+
+# Common tech terms matched in any text
+TECH_TERMS = (
+    ('python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust', 'php', 'ruby', 'swift', 'kotlin'),
+    ('react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring', 'hibernate'),
+    ('html', 'css', 'sass', 'less', 'bootstrap', 'tailwind'),
+    ('sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'cassandra', 'elasticsearch'),
+    ('aws', 'azure', 'gcp', 'heroku', 'digitalocean', 'linode'),
+    ('docker', 'kubernetes', 'terraform', 'ansible', 'puppet', 'chef'),
+    ('jenkins', 'github actions', 'gitlab ci', 'circleci', 'travis'),
+)
+# All groups fused into one alternation: a single findall per text instead of one per group
+_TECH_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(term) for terms in TECH_TERMS for term in terms) + r')\b', re.IGNORECASE
+)
+# Display names built once, so each hit adds an existing string instead of a fresh .title() copy
+_TECH_NAMES = {term: term.title() for terms in TECH_TERMS for term in terms}
+
+# Split points for very long certification lines holding several concatenated certificates
+# (whitespace after a word, followed by the name of the next certificate's topic)
+CERT_SPLIT_KEYWORDS = ('Machine Learning', 'Deep Learning', 'Large Language Models', 'TensorFlow', 'CNNs', 'RNNs',
+                       'Classification', 'Regression', 'EDA', 'Transformers', 'RAG', 'Agents', 'LangChain')
+_CERT_SPLIT_RE = re.compile(r'(?<=\w)\s+(?=' + '|'.join(re.escape(keyword) for keyword in CERT_SPLIT_KEYWORDS) + ')')
+
+# Bullet characters that mark an experience point
+POINT_MARKERS = '-•◦▪'
+
+# Project splitting: tech-stack lines, description verbs and the keywords that mark a project title
+PROJECT_TECH_PREFIXES = ('tech:', '• tech:', 'technologies:', '• technologies:', 'tools:', '• tools:')
+PROJECT_DESCRIPTION_VERBS = ('developed', 'created', 'produced', 'built', 'designed', 'constructed',
+                             'assembled', 'utilized', 'organized', 'strengthened', 'performed',
+                             'completed', 'integrated', 'deployed', 'trained', 'enhanced',
+                             'refined', 'retrieval', 'embeddings')
+PROJECT_TITLE_EXCLUDED_STARTS = ('developed', 'created', 'built', 'using', 'with')
+PROJECT_TITLE_KEYWORDS = ('system', 'pipeline', 'prediction', 'recommendation', 'model', 'application',
+                          'blend', 'churn', 'travel', 'hybrid', 'rag', 'customer')
+PROJECT_BULLET_TITLE_KEYWORDS = ('system', 'pipeline', 'prediction', 'recommendation', 'model', 'application',
+                                 'blend', 'churn')
+
+# Tokens of a header phrase: a whitespace run, an optional character or a literal character
+_HEADER_TOKEN_RE = re.compile(r'\\s\+|.\?|.')
+
+
+def _header_trie_pattern(alternatives: List[str]) -> str:
+    """
+    Merge header alternatives into one regex shaped like a trie (shared prefixes factored out)
+
+    Args:
+        alternatives: Header phrases built from literal characters, optional characters (x?) and \\s+
+
+    Returns:
+        Pattern matching exactly the same strings as '|'.join(alternatives); the regex engine
+        walks each shared prefix once instead of retrying it for every alternative
+    """
+    trie = {}
+    for alternative in alternatives:
+        node = trie
+        for token in _HEADER_TOKEN_RE.findall(alternative):
+            node = node.setdefault(token, {})
+        node[''] = {}  # End of a phrase
+
+    def emit(node: Dict) -> str:
+        branches = [token + emit(child) for token, child in sorted(node.items()) if token]
+        if not branches:
+            return ''
+        if '' in node:
+            branches.append('')
+        return branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+
+    return emit(trie)
+
+
+def _header_alternatives(pattern: str) -> List[str]:
+    """Phrases of a SECTION_PATTERNS entry, which are all written as one group: (a|b|...)"""
+    return pattern[1:-1].split('|')
 
 
 class RuleBasedParser:
@@ -24,11 +154,29 @@ class RuleBasedParser:
         'achievements': r'(achievements?|awards?|honors?|accomplishments?|recognitions?)',
     }
 
+    # Keywords of lines that end a section's content
+    SECTION_HEADER_KEYWORDS = ['EXPERIENCE', 'EDUCATION', 'SKILLS', 'PROJECTS', 'CERTIFICATIONS', 'ACHIEVEMENTS',
+                               'AWARDS', 'PROFESSIONAL SUMMARY', 'SUMMARY', 'OBJECTIVE']
+
     # Constants for parsing
     SECTION_BLOCK_SEPARATOR = r'\n\s*\n'
     DURATION_PATTERN = r'\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{4}\s*(?:-|to|–)\s*(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{4}|\b\d{4}\s*(?:-|to|–)\s*\d{4}'
     MIN_BLOCK_LENGTH = 50
 
+    # Compiled forms of the patterns above
+    _SECTION_RES = {
+        name: re.compile(_header_trie_pattern(_header_alternatives(pattern)), re.IGNORECASE)
+        for name, pattern in SECTION_PATTERNS.items()
+    }
+    _ANY_SECTION_RE = re.compile(
+        _header_trie_pattern([alt for pattern in SECTION_PATTERNS.values() for alt in _header_alternatives(pattern)]),
+        re.IGNORECASE
+    )
+    # All header keywords in one alternation, so the stop rule is a single search per line
+    _HEADER_KEYWORD_RE = re.compile('|'.join(re.escape(keyword) for keyword in SECTION_HEADER_KEYWORDS))
+    _BLOCK_SEPARATOR_RE = re.compile(SECTION_BLOCK_SEPARATOR)
+    _DURATION_RE = re.compile(DURATION_PATTERN, re.IGNORECASE)
+
     # Common skills to extract hardcoded for better recall (can be expanded)
     # if removed it will cause significant drop in skill extraction recall as many skills are mentioned in experience/project descriptions rather than a dedicated skills section
     # and relying solely on patterns will miss many skills that are not in a dedicated skills section or not mentioned in a standard way
@@ -37,6 +185,9 @@ class RuleBasedParser:
         'node.js', 'django', 'flask', 'machine learning', 'data analysis', 'excel',
         'power bi', 'tableau', 'aws', 'docker', 'git', 'agile', 'scrum'
     ]
+    # Built once: lowercased skill -> display name, and every skill in one \b-anchored alternation
+    _SKILL_TITLES = {skill.lower(): skill.title() for skill in SKILLS_LIST}
+    _SKILLS_RE = re.compile(r'\b(?:' + '|'.join(re.escape(skill) for skill in _SKILL_TITLES) + r')\b')
 
     # Technology keywords for projects
     TECH_KEYWORDS = ['python', 'java', 'react', 'node', 'sql', 'html', 'css', 'javascript', 'angular']
@@ -44,18 +195,26 @@ class RuleBasedParser:
     def __init__(self, text: str):
         self.text = text
         self.lines = [line.strip() for line in text.split('\n') if line.strip()]
+        # Lowercased once for the predicates that test self.lines case-insensitively
+        self.lines_lower = [line.lower() for line in self.lines]
+        self._sections = self._segment_sections()
 
     def parse(self) -> Dict:
         """Parse resume text into structured data"""
+        # Sections that skills are also mined from are parsed once and shared with _extract_skills
+        experience = self._extract_experience()
+        projects = self._extract_projects()
+        certifications = self._extract_certifications()
+        achievements = self._extract_achievements()
         return {
             'personal': self._extract_personal(),
             'summary': self._extract_summary(),
-            'skills': self._extract_skills(),
-            'experience': self._extract_experience(),
+            'skills': self._extract_skills(experience, projects, certifications, achievements),
+            'experience': experience,
             'education': self._extract_education(),
-            'projects': self._extract_projects(),
-            'certifications': self._extract_certifications(),
-            'achievements': self._extract_achievements(),
+            'projects': projects,
+            'certifications': certifications,
+            'achievements': achievements,
         }
 
     def _extract_personal(self) -> Dict:
@@ -78,61 +237,57 @@ class RuleBasedParser:
 
     def _extract_email(self) -> str:
         """Extract email address from text"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        match = re.search(email_pattern, self.text)
+        match = _EMAIL_RE.search(self.text)
         return match.group() if match else ''
 
     def _extract_phone(self) -> str:
         """Extract phone number from text"""
-        phone_pattern = r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
-        match = re.search(phone_pattern, self.text)
+        match = _PHONE_RE.search(self.text)
         return match.group() if match else ''
 
     def _extract_linkedin(self) -> str:
         """Extract LinkedIn profile URL"""
-        linkedin_pattern = r'linkedin\.com/in/[^\s]+'
-        match = re.search(linkedin_pattern, self.text, re.IGNORECASE)
+        match = _LINKEDIN_RE.search(self.text)
         return match.group() if match else ''
 
     def _extract_location(self) -> str:
         """Extract location from resume"""
         # Look for common location patterns in the first few lines
-        location_keywords = ['mumbai', 'delhi', 'pune', 'chennai', 'bangalore', 'hyderabad',
-                           'india', 'usa', 'uk', 'canada', 'australia']
-
-        for line in self.lines[:10]:  # Check first 10 lines
-            line_lower = line.lower()
-            for location in location_keywords:
-                if location in line_lower:
-                    # Extract the location word(s) and clean up
-                    words = line.split()
-                    for i, word in enumerate(words):
-                        if location in word.lower():
-                            # Return 1-2 words around the location, cleaned
-                            start = max(0, i-1)
-                            end = min(len(words), i+2)
-                            location_text = ' '.join(words[start:end])
-                            # Remove | and extra spaces
-                            location_text = location_text.replace('|', '').strip()
-                            return location_text
+        for line, line_lower in zip(self.lines[:10], self.lines_lower):  # Check first 10 lines
+            # One scan tells whether any keyword occurs; most lines have none
+            if not _LOCATION_RE.search(line_lower):
+                continue
+            # Keywords keep their priority order when a line mentions several
+            location = next(keyword for keyword in LOCATION_KEYWORDS if keyword in line_lower)
+            # Extract the location word(s) and clean up
+            words = line.split()
+            for i, word in enumerate(words):
+                if location in word.lower():
+                    # Return 1-2 words around the location, cleaned
+                    start = max(0, i-1)
+                    end = min(len(words), i+2)
+                    location_text = ' '.join(words[start:end])
+                    # Remove | and extra spaces
+                    location_text = location_text.replace('|', '').strip()
+                    return location_text
 
         return ''
 
     def _extract_name(self) -> str:
         """Extract name from first few lines"""
-        for line in self.lines[:5]:
-            if self._is_likely_name(line):
+        for line, line_lower in zip(self.lines[:5], self.lines_lower):
+            if self._is_likely_name(line, line_lower):
                 return line
         return ''
 
-    def _is_likely_name(self, line: str) -> bool:
-        """Check if a line looks like a name"""
+    def _is_likely_name(self, line: str, line_lower: str) -> bool:
+        """Check if a line (with its lowercased form) looks like a name"""
         if not line:
             return False
 
         # Skip lines with contact keywords
         contact_keywords = ['email', 'phone', 'linkedin', 'address', 'location']
-        if any(keyword in line.lower() for keyword in contact_keywords):
+        if any(keyword in line_lower for keyword in contact_keywords):
             return False
 
         # Check for 2-4 words, title case
@@ -146,8 +301,9 @@ class RuleBasedParser:
         """Extract professional summary"""
         return self._extract_section_content('summary')
 
-    def _extract_skills(self) -> List[str]:
-        """Extract skills from resume - comprehensive extraction from all sections"""
+    def _extract_skills(self, experience: List[Dict], projects: List[Dict],
+                        certifications: List[str], achievements: List[str]) -> List[str]:
+        """Extract skills from resume - comprehensive extraction from all sections (already parsed by parse())"""
         skills = set()  # Use set to avoid duplicates
 
         # Get skills from dedicated skills section
@@ -156,30 +312,26 @@ class RuleBasedParser:
             skills.update(self._extract_skills_from_text(skills_section))
 
         # Extract skills from projects
-        projects = self._extract_projects()
         for project in projects:
             skills.update(self._extract_skills_from_text(project.get('description', '')))
             skills.update(self._extract_skills_from_text(project.get('name', '')))
 
         # Extract skills from certifications
-        certifications = self._extract_certifications()
         for cert in certifications:
             skills.update(self._extract_skills_from_text(cert))
 
         # Extract skills from experience
-        experience = self._extract_experience()
         for exp in experience:
             skills.update(self._extract_skills_from_text(exp.get('title', '')))
             for point in exp.get('points', []):
                 skills.update(self._extract_skills_from_text(point))
 
         # Extract skills from achievements
-        achievements = self._extract_achievements()
         for achievement in achievements:
             skills.update(self._extract_skills_from_text(achievement))
 
         # Remove duplicates and sort
-        return sorted(list(skills))
+        return sorted(skills)
 
     def _extract_skills_from_text(self, text: str) -> List[str]:
         """Extract technical skills from any text using patterns and known skills"""
@@ -192,68 +344,15 @@ class RuleBasedParser:
         text_lower = text.lower()
 
         # First, match against known skills list
-        for skill in self.SKILLS_LIST:
-            if re.search(r'\b' + re.escape(skill.lower()) + r'\b', text_lower):
-                found_skills.add(skill.title())
-
-        # Additional comprehensive skill patterns
-        # This list can be expanded with more specific tools, frameworks, and technologies relevant to the target job roles
-        # This is used when skills are not mentioned in a dedicated skills section or not mentioned in a standard way and relying solely on patterns will miss many skills that are mentioned in experience/project descriptions
-        # when not using API calls and totally relying on offline patterns will miss many skills that are mentioned in experience/project descriptions
-        
-        extended_skills = [
-            # Programming & Frameworks
-            'scikit-learn', 'xgboost', 'catboost', 'optuna', 'mlflow', 'langchain', 'fastapi',
-            'transformers', 'llms', 'gpt-4o-mini', 'neo4j', 'cypher', 'pinecone', 'asyncio',
-            'pytorch', 'tensorflow', 'keras', 'pandas', 'numpy', 'matplotlib', 'seaborn',
-            'jupyter', 'docker', 'kubernetes', 'jenkins', 'github actions', 'spark', 'hadoop',
-            'kafka', 'redis', 'mongodb', 'postgresql', 'mysql', 'sqlite',
-
-            # Cloud & DevOps
-            'aws s3', 'aws ec2', 'aws lambda', 'azure', 'gcp', 'heroku', 'vercel',
-
-            # ML/DL/NLP
-            'machine learning', 'deep learning', 'natural language processing', 'nlp',
-            'computer vision', 'reinforcement learning', 'supervised learning', 'unsupervised learning',
-            'regression', 'classification', 'clustering', 'dimensionality reduction', 'feature engineering',
-            'hyperparameter tuning', 'cross-validation', 'ensemble methods', 'neural networks',
-            'convolutional neural networks', 'recurrent neural networks', 'transformers',
-            'bert', 'gpt', 'rag', 'retrieval-augmented generation', 'vector embeddings',
-            'semantic search', 'knowledge graphs',
-
-            # Data Science
-            'data analysis', 'data visualization', 'eda', 'exploratory data analysis',
-            'statistical analysis', 'a/b testing', 'hypothesis testing', 'time series analysis',
-
-            # MLOps
-            'model deployment', 'model monitoring', 'model versioning', 'ci/cd', 'pipeline',
-            'experiment tracking', 'model registry', 'feature store',
-
-            # Other Technical
-            'api development', 'rest api', 'graphql', 'microservices', 'agile', 'scrum',
-            'git', 'version control', 'linux', 'bash', 'powershell'
-        ]
-
-        for skill in extended_skills:
-            if skill in text_lower:
-                # Title case the skill name
-                found_skills.add(' '.join(word.capitalize() for word in skill.split()))
+        found_skills.update(self._SKILL_TITLES[match] for match in self._SKILLS_RE.findall(text_lower))
+
+        # Additional comprehensive skill patterns (see EXTENDED_SKILLS)
+        found_skills.update(name for skill, name in _EXTENDED_SKILL_NAMES if skill in text_lower)
 
         # Extract skills using regex patterns for common tech terms
-        tech_patterns = [
-            r'\b(?:python|java|javascript|typescript|c\+\+|c#|go|rust|php|ruby|swift|kotlin)\b',
-            r'\b(?:react|angular|vue|node\.js|express|django|flask|spring|hibernate)\b',
-            r'\b(?:html|css|sass|less|bootstrap|tailwind)\b',
-            r'\b(?:sql|mysql|postgresql|mongodb|redis|cassandra|elasticsearch)\b',
-            r'\b(?:aws|azure|gcp|heroku|digitalocean|linode)\b',
-            r'\b(?:docker|kubernetes|terraform|ansible|puppet|chef)\b',
-            r'\b(?:jenkins|github actions|gitlab ci|circleci|travis)\b'
-        ]
-
-        for pattern in tech_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            for match in matches:
-                found_skills.add(match.title() if isinstance(match, str) else str(match).title())
+        for match in _TECH_RE.findall(text_lower):
+            # Case-insensitive matching can still hit non-ASCII case variants; title-case those as before
+            found_skills.add(_TECH_NAMES.get(match) or match.title())
 
         return list(found_skills)
 
@@ -265,7 +364,7 @@ class RuleBasedParser:
             return []
 
         experiences = []
-        blocks = re.split(self.SECTION_BLOCK_SEPARATOR, exp_section)
+        blocks = self._BLOCK_SEPARATOR_RE.split(exp_section)
 
         for block in blocks:
             if len(block.strip()) < self.MIN_BLOCK_LENGTH:
@@ -304,14 +403,14 @@ class RuleBasedParser:
                 exp['location'] = parts[1].strip()
 
             # Extract duration (date ranges)
-            duration_match = re.search(r'\d{1,2}/\d{4}\s*[–-]\s*\d{1,2}/\d{4}', first_line)
+            duration_match = _DURATION_NUMERIC_RE.search(first_line)
             if duration_match:
                 exp['duration'] = duration_match.group()
                 # Remove duration from the line for cleaner parsing
                 first_line = first_line.replace(duration_match.group(), '').strip()
                 # Clean up extra commas/spaces
-                first_line = re.sub(r',\s*,', ',', first_line)
-                first_line = re.sub(r'\s+', ' ', first_line)
+                first_line = _DOUBLE_COMMA_RE.sub(',', first_line)
+                first_line = ' '.join(first_line.split())  # Collapse whitespace runs
 
             # Now parse company and title
             # Pattern: "Company, Title"
@@ -326,7 +425,7 @@ class RuleBasedParser:
         # Check next line for duration if not found in first line
         if not exp['duration'] and len(lines) > 1:
             second_line = lines[1].strip()
-            duration_match = re.search(r'\d{1,2}/\d{4}\s*[–-]\s*\d{1,2}/\d{4}', second_line)
+            duration_match = _DURATION_NUMERIC_RE.search(second_line)
             if duration_match:
                 exp['duration'] = duration_match.group()
 
@@ -350,7 +449,7 @@ class RuleBasedParser:
 
     def _extract_duration_from_text(self, text: str) -> str:
         """Extract duration pattern from text"""
-        match = re.search(self.DURATION_PATTERN, text, re.IGNORECASE)
+        match = self._DURATION_RE.search(text)
         return match.group() if match else ''
 
     def _extract_points_from_lines(self, lines: List[str]) -> List[str]:
@@ -361,9 +460,9 @@ class RuleBasedParser:
             if not line:
                 continue
 
-            # Remove bullet markers
-            if line.startswith(('-', '•', '◦', '▪')):
-                points.append(line[1:].strip())
+            # Remove bullet markers (exactly one leading marker character, as before)
+            if line[0] in POINT_MARKERS:
+                points.append(line[1:].lstrip())
             elif len(line) > 20:  # Longer lines as points
                 points.append(line)
 
@@ -377,7 +476,7 @@ class RuleBasedParser:
             return []
 
         education = []
-        blocks = re.split(self.SECTION_BLOCK_SEPARATOR, edu_section)
+        blocks = self._BLOCK_SEPARATOR_RE.split(edu_section)
 
         for block in blocks:
             lines = block.strip().split('\n')
@@ -408,13 +507,13 @@ class RuleBasedParser:
                 continue
 
             # Extract GPA
-            gpa_match = re.search(r'GPA[:\s]*([\d.]+)', line, re.IGNORECASE)
+            gpa_match = _GPA_RE.search(line)
             if gpa_match:
                 edu['gpa'] = gpa_match.group(1)
                 continue
 
             # Extract year
-            year_match = re.search(r'\b(19|20)\d{2}\b', line)
+            year_match = _YEAR_RE.search(line)
             if year_match and not edu['year']:
                 edu['year'] = year_match.group()
                 # Remove year from line for cleaner parsing
@@ -428,8 +527,8 @@ class RuleBasedParser:
                 potential_institution = parts[1].strip()
 
                 # Clean up institution (remove year/location markers)
-                potential_institution = re.sub(r'\s*\d{1,2}/\d{4}.*', '', potential_institution)
-                potential_institution = re.sub(r'\s*\|\s*.*', '', potential_institution)
+                potential_institution = _INSTITUTION_DATE_RE.sub('', potential_institution)
+                potential_institution = _INSTITUTION_PIPE_RE.sub('', potential_institution)
 
                 # Check if institution contains university/college keywords
                 if any(word in potential_institution.lower() for word in ['university', 'college', 'institute', 'school']):
@@ -476,54 +575,48 @@ class RuleBasedParser:
         seen_titles = set()  # Track seen titles to avoid duplicates
 
         for i, line in enumerate(lines):
-            line_lower = line.lower().strip()
+            line_lower = line.lower()
 
             # Skip tech lines
-            if line_lower.startswith(('tech:', '• tech:', 'technologies:', '• technologies:', 'tools:', '• tools:')):
+            if line_lower.startswith(PROJECT_TECH_PREFIXES):
                 continue
 
             # Skip description bullet points (start with action verbs or are continuations)
-            if line.startswith('•'):
+            is_bullet = line.startswith('•')
+            if is_bullet:
                 clean_line = line[1:].strip().lower()
-                if (clean_line.startswith(('developed', 'created', 'produced', 'built', 'designed', 'constructed',
-                                        'assembled', 'utilized', 'organized', 'strengthened', 'performed',
-                                        'completed', 'integrated', 'deployed', 'trained', 'enhanced',
-                                        'refined', 'retrieval', 'embeddings'))) or \
-                   ('and' in clean_line and len(clean_line.split()) > 10):  # Continuation lines
+                if (clean_line.startswith(PROJECT_DESCRIPTION_VERBS) or
+                        ('and' in clean_line and len(clean_line.split()) > 10)):  # Continuation lines
                     continue
 
             # Project titles:
             # 1. Lines with colons (like "Shell.ai: Multi-Output Fuel Blend Property Prediction")
-            if ':' in line and len(line.split(':')[0].strip()) > 3:
+            colon = line.find(':')
+            if colon != -1 and len(line[:colon].strip()) > 3:
                 # Use the full title after the colon for uniqueness, but normalize for comparison
-                full_title = line.strip().lower()
-                normalized_title = full_title.replace('multioutput', 'multi-output').replace(' ', '').replace(':', '')
+                normalized_title = line_lower.replace('multioutput', 'multi-output').replace(' ', '').replace(':', '')
                 if normalized_title not in seen_titles:
                     title_indices.append(i)
                     seen_titles.add(normalized_title)
             # 2. Standalone project titles (no colon, title case or technical titles, reasonable length)
-            elif (not ':' in line and
+            elif (colon == -1 and
                   3 <= len(line.split()) <= 8 and
-                  not line_lower.startswith(('developed', 'created', 'built', 'using', 'with')) and
+                  not line_lower.startswith(PROJECT_TITLE_EXCLUDED_STARTS) and
                   not line.islower() and  # Not all lowercase
-                  any(keyword in line_lower for keyword in ['system', 'pipeline', 'prediction', 'recommendation',
-                                                           'model', 'application', 'blend', 'churn', 'travel',
-                                                           'hybrid', 'rag', 'customer'])):
-                normalized_title = line.lower().replace(' ', '')
+                  any(keyword in line_lower for keyword in PROJECT_TITLE_KEYWORDS)):
+                normalized_title = line_lower.replace(' ', '')
                 if normalized_title not in seen_titles:
                     title_indices.append(i)
                     seen_titles.add(normalized_title)
             # 3. Short bullet points that look like project names
-            elif line.startswith('•') and len(line) < 60 and not clean_line.startswith(('developed', 'created')):
+            elif is_bullet and len(line) < 60 and not clean_line.startswith(('developed', 'created')):
                 # Additional check: should contain project-like keywords
-                if any(keyword in clean_line for keyword in ['system', 'pipeline', 'prediction', 'recommendation',
-                                                           'model', 'application', 'blend', 'churn']):
+                if any(keyword in clean_line for keyword in PROJECT_BULLET_TITLE_KEYWORDS):
                     if clean_line not in seen_titles:
                         title_indices.append(i)
                         seen_titles.add(clean_line)
 
-        # Remove duplicates and sort
-        title_indices = sorted(list(set(title_indices)))
+        # Indices were collected in increasing order, each line at most once, so they are already sorted
 
         # If no titles found, return whole text as one block
         if not title_indices:
@@ -556,7 +649,7 @@ class RuleBasedParser:
                 continue
 
             # This should be the project name - handle both bullet and non-bullet titles
-            clean_name = re.sub(r'[•\-*]\s*', '', line).strip()
+            clean_name = _BULLET_MARKER_RE.sub('', line).strip()
             if clean_name and len(clean_name) > 5:  # Avoid very short names
                 proj['name'] = clean_name
                 break
@@ -568,13 +661,14 @@ class RuleBasedParser:
             line = line.strip()
             if not line:
                 continue
+            line_lower = line.lower()
 
             # Check for tech stack (case-insensitive, with or without bullet)
-            if line.lower().startswith(('tech:', 'technologies:', 'tech stack:', 'tools:')) or \
-               line.lower().startswith(('• tech:', '• technologies:', '• tech stack:', '• tools:')):
+            if line_lower.startswith(('tech:', 'technologies:', 'tech stack:', 'tools:',
+                                      '• tech:', '• technologies:', '• tech stack:', '• tools:')):
                 tech_part = line.split(':', 1)[1] if ':' in line else line
                 # Clean up bullet markers
-                tech_part = re.sub(r'[•\-*]\s*', '', tech_part)
+                tech_part = _BULLET_MARKER_RE.sub('', tech_part)
                 proj['tech'] = [tech.strip() for tech in tech_part.split(',') if tech.strip()]
                 continue
 
@@ -584,7 +678,7 @@ class RuleBasedParser:
                 # Skip if it's the project title
                 if clean_bullet and proj['name'] and not clean_bullet.startswith(proj['name'][:20]):
                     bullet_points.append(clean_bullet)
-            elif len(line) > 10 and not line.lower().startswith(('tech:', 'technologies:', 'tech stack:', 'tools:')):
+            elif len(line) > 10 and not line_lower.startswith(('tech:', 'technologies:', 'tech stack:', 'tools:')):
                 # Use as bullet point if it's not the title
                 if proj['name'] and not line.startswith(proj['name'][:20]):
                     bullet_points.append(line)
@@ -636,22 +730,8 @@ class RuleBasedParser:
                         certs.append(part)
             elif len(line) > 100:  # Very long line likely contains multiple certs
                 # Try to split on common certification keywords
-                import re
                 # Split on patterns like "Machine Learning", "Deep Learning", etc.
-                split_patterns = [
-                    r'(?<=\w)\s+(?=Machine Learning)',
-                    r'(?<=\w)\s+(?=Deep Learning)',
-                    r'(?<=\w)\s+(?=Large Language Models)',
-                    r'(?<=\w)\s+(?=TensorFlow)',
-                    r'(?<=\w)\s+(?=CNNs|RNNs)',
-                    r'(?<=\w)\s+(?=Classification|Regression|EDA)',
-                    r'(?<=\w)\s+(?=Transformers|RAG|Agents)',
-                    r'(?<=\w)\s+(?=LangChain)',
-                ]
-
-                temp_line = line
-                for pattern in split_patterns:
-                    temp_line = re.sub(pattern, '\n', temp_line)
+                temp_line = _CERT_SPLIT_RE.sub('\n', line)
 
                 if '\n' in temp_line:
                     split_certs = temp_line.split('\n')
@@ -688,61 +768,59 @@ class RuleBasedParser:
 
     def _extract_section_content(self, section_name: str) -> str:
         """Extract content of a specific section with improved header detection"""
-        pattern = self.SECTION_PATTERNS.get(section_name)
-        if not pattern:
-            return ""
+        return self._sections.get(section_name, "")
+
+    def _segment_sections(self) -> Dict[str, str]:
+        """
+        Split the resume into section contents in one pass over the lines
 
+        Returns:
+            Content of every section whose header was found, keyed by SECTION_PATTERNS name
+        """
         lines = self.lines
-        section_start = -1
+        n_lines = len(lines)
+
+        # next_header[j] = first line at or after j that ends a section (n_lines if none),
+        # so the stop rule runs once per line instead of once per line per section
+        next_header = [n_lines] * (n_lines + 1)
+        for j in range(n_lines - 1, -1, -1):
+            next_header[j] = j if self._is_section_boundary(lines[j]) else next_header[j + 1]
 
         # Find the best section header (prioritize standalone headers)
+        best_start = {}
+        fallback_start = {}
         for i, line in enumerate(lines):
-            line_stripped = line.strip()
-
-            # Skip empty lines
-            if not line_stripped:
+            # One combined search skips lines that match no section pattern at all
+            if not self._ANY_SECTION_RE.search(line):
                 continue
-
-            # Check if this line matches the section pattern
-            if re.search(pattern, line_stripped, re.IGNORECASE):
+            line_lower = self.lines_lower[i]
+            is_short = len(line.split()) <= 3  # Short headers like "EXPERIENCE"
+            for section_name, pattern in self._SECTION_RES.items():
+                if section_name in best_start or not pattern.search(line):
+                    continue
                 # Prioritize headers that are standalone or at line start
-                if (line_stripped.lower() == section_name or
-                    line_stripped.lower().startswith(section_name) or
-                    len(line_stripped.split()) <= 3):  # Short headers like "EXPERIENCE"
-                    section_start = i
-                    break
-                elif section_start == -1:  # Keep as fallback if no better match
-                    section_start = i
-
-        if section_start == -1:
-            return ""
+                if line_lower == section_name or line_lower.startswith(section_name) or is_short:
+                    best_start[section_name] = i
+                elif section_name not in fallback_start:  # Keep as fallback if no better match
+                    fallback_start[section_name] = i
 
         # Extract content until next section header
-        content_lines = []
-        for j in range(section_start + 1, len(lines)):
-            next_line = lines[j].strip()
-
-            # Stop if we hit another section header
-            if next_line:
-                is_section_header = False
-
-                # Check if this line is a clear section header
-                line_upper = next_line.upper()
-                if (len(next_line.split()) <= 4 and  # Short lines
-                    any(keyword in line_upper for keyword in ['EXPERIENCE', 'EDUCATION', 'SKILLS', 'PROJECTS', 'CERTIFICATIONS', 'ACHIEVEMENTS', 'AWARDS', 'PROFESSIONAL SUMMARY', 'SUMMARY', 'OBJECTIVE'])):
-                    is_section_header = True
-                elif next_line.isupper() and len(next_line) > 5:  # ALL CAPS lines that are substantial
-                    is_section_header = True
-                elif re.match(r'^[A-Z\s]+$', next_line) and len(next_line) > 5:  # All caps with spaces
-                    is_section_header = True
-
-                if is_section_header:
-                    break
-
-            content_lines.append(lines[j])
-
-        return '\n'.join(content_lines).strip()
-
+        sections = {}
+        for section_name in self._SECTION_RES:
+            section_start = best_start.get(section_name, fallback_start.get(section_name, -1))
+            if section_start != -1:
+                content_lines = lines[section_start + 1:next_header[section_start + 1]]
+                sections[section_name] = '\n'.join(content_lines).strip()
+        return sections
+
+    def _is_section_boundary(self, line: str) -> bool:
+        """Check if a (non-empty) line is a clear section header that ends the current section"""
+        # ALL CAPS lines that are substantial (also covers all caps with spaces: a stripped,
+        # non-empty line of A-Z and whitespace is always isupper()), tested first as the cheapest
+        if len(line) > 5 and line.isupper():
+            return True
+        return (len(line.split()) <= 4 and  # Short lines
+                self._HEADER_KEYWORD_RE.search(line.upper()) is not None)
 
 def parse_resume_rule_based(text: str) -> Dict:
     """
@@ -1,44 +1,81 @@
 import re
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from collections import Counter
+from app.utils.helpers import STOP_WORDS, flatten_strings
+
+
+# Lowercase word tokens pulled from the job description
+_WORD_RE = re.compile(r'\b[a-z]+\b')
+_DIGIT_RE = re.compile(r'\d')
+
+# Technical terms and skills to prioritize among JD keywords
+_PRIORITY_TECH_TERMS = frozenset({
+    'python', 'java', 'javascript', 'react', 'node', 'sql', 'aws', 'docker',
+    'kubernetes', 'api', 'machine learning', 'data', 'cloud', 'agile', 'scrum',
+    'git', 'ci/cd', 'microservices', 'rest', 'testing', 'angular', 'vue'
+})
+
+# Expected skills per job role, matched as substrings of the lowercased role (read-only tuples)
+_ROLE_SKILLS_MAP = {
+    'software engineer': ('python', 'java', 'javascript', 'git', 'sql', 'api', 'testing'),
+    'data scientist': ('python', 'machine learning', 'sql', 'statistics', 'pandas', 'tensorflow'),
+    'frontend developer': ('react', 'javascript', 'html', 'css', 'typescript'),
+    'backend developer': ('python', 'java', 'node.js', 'sql', 'api', 'docker'),
+    'full stack': ('react', 'node.js', 'javascript', 'sql', 'api', 'git'),
+    'devops': ('docker', 'kubernetes', 'ci/cd', 'aws', 'linux', 'terraform'),
+    'data engineer': ('python', 'sql', 'spark', 'kafka', 'etl', 'aws'),
+}
 
 
 class SuggestionGenerator:
     """Generate resume improvement suggestions using rule-based heuristics"""
     
-    def __init__(self, resume_data: Dict, job_role: str, job_desc: str, score_breakdown: Dict):
+    def __init__(self, resume_data: Dict, job_role: str, job_desc: str, score_breakdown: Optional[Dict] = None):
         self.resume_data = resume_data
         self.job_role = job_role.lower()
         self.job_desc = job_desc.lower() if job_desc else ""
         self.score_breakdown = score_breakdown
         self.suggestions = []
         self.suggestion_id = 0
+        self._high_count = 0
+        self._missing_keywords = None
+        self._missing_skills = None
+    
+    def prepare(self) -> 'SuggestionGenerator':
+        """
+        Score-independent phase (JD keyword and role skill gaps), called inline before scoring
+        generate_suggestions() calls it if it hasn't run yet
+        """
+        if self._missing_keywords is None:
+            self._missing_keywords = self._find_missing_keywords()
+            self._missing_skills = self._find_missing_skills()
+        return self
     
     def generate_suggestions(self) -> List[Dict]:
         """Generate prioritized suggestions"""
+        self.prepare()
         
-        # Generate suggestions based on gaps
-        if self.score_breakdown['keyword_match'] < 20:
-            self._suggest_keywords()
-        
-        if self.score_breakdown['skills_relevance'] < 18:
-            self._suggest_skills()
-        
-        if self.score_breakdown['format_quality'] < 15:
-            self._suggest_format_improvements()
-        
-        if self.score_breakdown['experience_alignment'] < 10:
-            self._suggest_experience_improvements()
-        
-        if self.score_breakdown['completeness'] < 8:
-            self._suggest_completeness()
-        
-        # Always suggest quantifiable achievements if missing
-        self._suggest_quantifiable_achievements()
+        # Generate suggestions based on gaps (in this order, which also assigns the ids)
+        steps = (
+            (self.score_breakdown['keyword_match'] < 20, self._suggest_keywords),
+            (self.score_breakdown['skills_relevance'] < 18, self._suggest_skills),
+            (self.score_breakdown['format_quality'] < 15, self._suggest_format_improvements),
+            (self.score_breakdown['experience_alignment'] < 10, self._suggest_experience_improvements),
+            (self.score_breakdown['completeness'] < 8, self._suggest_completeness),
+            (True, self._suggest_quantifiable_achievements),  # Always suggest quantifiable achievements if missing
+        )
+        for needed, suggest in steps:
+            # Five high-priority suggestions already fill the top 5: later ones can't displace them
+            if self._high_count >= 5:
+                break
+            if needed:
+                suggest()
         
-        # Sort by priority
-        priority_order = {'high': 0, 'medium': 1, 'low': 2}
-        self.suggestions.sort(key=lambda x: priority_order.get(x['priority'], 2))
+        # Stable bucket sort by priority (unknown priorities rank as low)
+        buckets = {'high': [], 'medium': [], 'low': []}
+        for suggestion in self.suggestions:
+            buckets.get(suggestion['priority'], buckets['low']).append(suggestion)
+        self.suggestions = buckets['high'] + buckets['medium'] + buckets['low']
         
         return self.suggestions[:5]  # Return top 5 suggestions
     
@@ -53,18 +90,25 @@ class SuggestionGenerator:
             'priority': priority
         })
         self.suggestion_id += 1
+        if priority == 'high':
+            self._high_count += 1
     
-    def _suggest_keywords(self):
-        """Suggest adding missing keywords from job description"""
+    def _find_missing_keywords(self) -> List[str]:
+        """JD keywords that do not appear anywhere in the resume"""
         if not self.job_desc:
-            return
+            return []
         
         # Extract keywords from job description
         jd_keywords = self._extract_important_keywords(self.job_desc)
-        resume_text = str(self.resume_data).lower()
+        # Only the resume's own text: str(resume_data) also carried field names like 'experience'
+        # and 'description', which made those JD keywords look present in every resume
+        resume_text = ' '.join(flatten_strings(self.resume_data)).lower()
         
-        # Find missing keywords
-        missing = [kw for kw in jd_keywords if kw not in resume_text]
+        return [kw for kw in jd_keywords if kw not in resume_text]
+    
+    def _suggest_keywords(self):
+        """Suggest adding missing keywords from job description"""
+        missing = self._missing_keywords
         
         if missing:
             # Group by relevance
@@ -78,13 +122,17 @@ class SuggestionGenerator:
                 priority='high'
             )
     
-    def _suggest_skills(self):
-        """Suggest adding role-specific skills"""
+    def _find_missing_skills(self) -> List[str]:
+        """Expected role skills not covered by any listed skill"""
         expected_skills = self._get_expected_skills_for_role()
-        current_skills = [s.lower() for s in self.resume_data.get('skills', [])]
+        # Newline-joined so one substring test per expected skill still has to fall within a single listed skill
+        current_skills = '\n'.join(s.lower() for s in self.resume_data.get('skills', []))
         
-        # Find missing critical skills
-        missing_skills = [s for s in expected_skills if not any(s in cs for cs in current_skills)]
+        return [s for s in expected_skills if s not in current_skills]
+    
+    def _suggest_skills(self):
+        """Suggest adding role-specific skills"""
+        missing_skills = self._missing_skills
         
         if missing_skills:
             top_missing = missing_skills[:4]
@@ -203,42 +251,32 @@ class SuggestionGenerator:
     
     def _extract_important_keywords(self, text: str) -> List[str]:
         """Extract important keywords from job description"""
-        # Technical terms and skills to prioritize
-        tech_terms = {
-            'python', 'java', 'javascript', 'react', 'node', 'sql', 'aws', 'docker',
-            'kubernetes', 'api', 'machine learning', 'data', 'cloud', 'agile', 'scrum',
-            'git', 'ci/cd', 'microservices', 'rest', 'testing', 'angular', 'vue'
-        }
-        
-        # Extract all words
-        words = re.findall(r'\b[a-z]+\b', text)
-        word_freq = Counter(words)
+        # Count content words only, so stop words don't crowd real terms out of the top 30
+        word_freq = Counter(
+            word for word in _WORD_RE.findall(text)
+            if len(word) >= 3 and word not in STOP_WORDS
+        )
         
         # Prioritize technical terms and frequently mentioned words
-        keywords = []
-        for word, freq in word_freq.most_common(30):
-            if word in tech_terms or freq > 2:
-                keywords.append(word)
+        keywords = [
+            word for word, freq in word_freq.most_common(30)
+            if word in _PRIORITY_TECH_TERMS or freq > 2
+        ]
         
         return keywords[:10]
     
-    def _get_expected_skills_for_role(self) -> List[str]:
+    def _get_expected_skills_for_role(self) -> Tuple[str, ...]:
         """Get expected skills based on job role"""
-        role_skills_map = {
-            'software engineer': ['python', 'java', 'javascript', 'git', 'sql', 'api', 'testing'],
-            'data scientist': ['python', 'machine learning', 'sql', 'statistics', 'pandas', 'tensorflow'],
-            'frontend developer': ['react', 'javascript', 'html', 'css', 'typescript'],
-            'backend developer': ['python', 'java', 'node.js', 'sql', 'api', 'docker'],
-            'full stack': ['react', 'node.js', 'javascript', 'sql', 'api', 'git'],
-            'devops': ['docker', 'kubernetes', 'ci/cd', 'aws', 'linux', 'terraform'],
-            'data engineer': ['python', 'sql', 'spark', 'kafka', 'etl', 'aws'],
-        }
+        # Exact role names skip the scan (no key is a substring of another, so the result is the same)
+        skills = _ROLE_SKILLS_MAP.get(self.job_role)
+        if skills:
+            return skills
         
-        for role_key, skills in role_skills_map.items():
+        for role_key, skills in _ROLE_SKILLS_MAP.items():
             if role_key in self.job_role:
                 return skills
         
-        return ['problem solving', 'teamwork', 'communication']
+        return ('problem solving', 'teamwork', 'communication')
     
     def _generate_summary_example(self) -> str:
         """Generate example professional summary"""
@@ -259,7 +297,7 @@ class SuggestionGenerator:
     
     def _has_numbers(self, text: str) -> bool:
         """Check if text contains numbers/metrics"""
-        return bool(re.search(r'\d', text))
+        return _DIGIT_RE.search(text) is not None
 
 
 def generate_suggestions_rule_based(resume_data: Dict, job_role: str, job_desc: str, score_breakdown: Dict) -> List[Dict]:
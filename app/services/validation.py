@@ -0,0 +1,62 @@
+"""
+Resume Data Validation
+Shared checks for parsed, enhanced and to-be-generated resume data
+"""
+
+from typing import List, Tuple
+
+REQUIRED_KEYS = ('personal', 'skills', 'experience', 'education')
+CONTENT_KEYS = ('skills', 'experience', 'education')
+
+
+def has_content(data: dict) -> bool:
+    """
+    Check that at least one content section has data (stops at the first non-empty one)
+    
+    Args:
+        data: Resume data
+        
+    Returns:
+        True if skills, experience, education or summary is non-empty
+    """
+    return any(data.get(key) for key in CONTENT_KEYS) or bool((data.get('summary') or '').strip())
+
+
+def validate(data: dict, strict: bool = True) -> Tuple[bool, List[str]]:
+    """
+    Validate resume data
+    
+    Args:
+        data: Resume data to validate
+        strict: Require both name and email (resume generation); otherwise
+                name or email is enough (parsed/enhanced data)
+        
+    Returns:
+        Tuple of (is_valid, errors)
+    """
+    if not isinstance(data, dict):
+        return False, ["Resume data must be a dictionary"]
+    
+    errors = []
+    
+    # Check required top-level keys
+    for key in REQUIRED_KEYS:
+        if key not in data:
+            errors.append(f"Missing required section: {key}")
+    
+    # Check personal information
+    personal = data.get('personal') or {}
+    if strict:
+        if 'personal' in data:
+            if not personal.get('name'):
+                errors.append("Name is required in personal section")
+            if not personal.get('email'):
+                errors.append("Email is recommended in personal section")
+    elif not (personal.get('name') or personal.get('email')):
+        errors.append("Name or email is required in personal section")
+    
+    # Check if at least one content section has data
+    if not has_content(data):
+        errors.append("Resume must have at least one content section with data")
+    
+    return len(errors) == 0, errors
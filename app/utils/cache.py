@@ -0,0 +1,143 @@
+"""
+Persistent Cache
+SQLite-backed key/value store used to memoize deterministic results across requests and restarts,
+plus an in-process LRU for values that must stay in memory
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+import orjson
+
+
+# Directory holding the cache databases: CACHE_DIR if set, else cache/ at the project root
+CACHE_DIR = os.path.abspath(os.getenv(
+    'CACHE_DIR', os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'cache')
+))
+
+
+def make_cache_key(*parts) -> str:
+    """
+    Build a stable cache key from arbitrary parts
+
+    Args:
+        *parts: bytes or values convertible to str (e.g. file bytes, job role, job description)
+
+    Returns:
+        SHA-256 hex digest of the parts
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode('utf-8'))
+        digest.update(b'\x1f')  # Separator so ("ab", "c") != ("a", "bc")
+    return digest.hexdigest()
+
+
+class PersistentCache:
+    """JSON-serializable values stored in SQLite with a per-entry expiry"""
+
+    def __init__(self, path: str, default_ttl: int = 86400):
+        """
+        Args:
+            path: SQLite database file, relative paths are resolved under CACHE_DIR
+                  (the file and its directory are created on first use)
+            default_ttl: Default time-to-live in seconds
+        """
+        self.path = os.path.join(CACHE_DIR, path)
+        self.default_ttl = default_ttl
+        self._initialized = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per operation keeps the cache safe to use from worker threads
+        conn = sqlite3.connect(self._ensure_created(), timeout=5)
+        try:
+            with conn:  # Commit on success, roll back on error
+                yield conn
+        finally:
+            conn.close()
+
+    def _ensure_created(self) -> str:
+        """Create the directory and table on first use (not at import, which also runs in every worker process)"""
+        if not self._initialized:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5)
+            try:
+                with conn:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+                    )
+            finally:
+                conn.close()
+            self._initialized = True
+        return self.path
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT value, expires_at FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] < time.time():
+                conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+        return orjson.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        """
+        Store a value
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Time-to-live in seconds (default: default_ttl)
+        """
+        expires_at = time.time() + (self.default_ttl if ttl is None else ttl)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, orjson.dumps(value), expires_at)
+            )
+
+
+class MemoryCache:
+    """In-process LRU with the same get/set interface, for values that must not be written to disk"""
+
+    def __init__(self, maxsize: int = 64):
+        """
+        Args:
+            maxsize: Number of entries kept; the least recently used one is evicted beyond that
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value, or None if missing"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any):
+        """Store a value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
@@ -6,7 +6,30 @@ Provides common utility functions used across the application
 import os
 import json
 import re
-from typing import Any, Dict
+from datetime import datetime
+from typing import Any, Dict, Iterator
+
+import orjson
+
+
+# Characters replaced with underscores in filenames (unsafe on common filesystems, plus spaces)
+_UNSAFE_FILENAME_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?* '})
+
+# Patterns used by the string helpers, compiled once at import
+_LOWER_WORD_RE = re.compile(r'\b[a-z]+\b')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_FORMATTING_RE = re.compile(r'[\s\-\(\)\.]')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_NON_SLUG_CHARS_RE = re.compile(r'[^a-z0-9]+')
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Common stop words skipped by keyword extraction
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should',
+    'could', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those'
+})
 
 
 def ensure_directories():
@@ -14,12 +37,10 @@ def ensure_directories():
     Create necessary directories if they don't exist
     
     Creates:
-        - uploads/: Temporary storage for uploaded files
         - outputs/: Storage for generated resume files
     """
-    os.makedirs("uploads", exist_ok=True)
     os.makedirs("outputs", exist_ok=True)
-    print("Directories initialized: uploads/, outputs/")
+    print("Directories initialized: outputs/")
 
 
 def clean_json_response(text: str) -> str:
@@ -34,25 +55,67 @@ def clean_json_response(text: str) -> str:
     """
     text = text.strip()
     
-    # Remove ```json ... ``` blocks
+    # Remove ```json ... ``` blocks (a missing closing fence keeps the rest of the text)
     if text.startswith('```json'):
-        text = text.split('```json', 1)[1]
-        text = text.split('```', 1)[0]
-        text = text.strip()
+        text = text[7:].partition('```')[0].strip()
     
     # Remove ``` ... ``` blocks
     elif text.startswith('```'):
-        text = text.split('```', 1)[1]
-        text = text.split('```', 1)[0]
-        text = text.strip()
+        text = text[3:].partition('```')[0].strip()
     
     return text
 
 
+def extract_balanced_json(text: str) -> str:
+    """
+    Extract the first balanced JSON object/array from text
+    
+    Args:
+        text: Text that contains a JSON value surrounded by other content
+        
+    Returns:
+        The JSON substring, or "" if no balanced value is found
+    """
+    start = -1
+    for i, char in enumerate(text):
+        if char in '{[':
+            start = i
+            break
+    if start == -1:
+        return ""
+    
+    closing = {'{': '}', '[': ']'}
+    stack = []
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in closing:
+            stack.append(closing[char])
+        elif char in '}]':
+            if not stack or stack.pop() != char:
+                return ""
+            if not stack:
+                return text[start:i + 1]
+    return ""
+
+
 def parse_json_safe(text: str) -> dict:
     """
     Safely parse JSON from AI response
     
+    Tries, in order: markdown-fence stripping + direct parse, then the first balanced
+    {...}/[...] in the text (handles leading/trailing prose) - no LLM retry needed
+    
     Args:
         text: JSON string (possibly with markdown)
         
@@ -65,14 +128,24 @@ def parse_json_safe(text: str) -> dict:
     cleaned = clean_json_response(text)
     
     try:
-        return json.loads(cleaned)
-    except json.JSONDecodeError as e:
-        # Show preview of problematic content
-        preview = cleaned[:500] if len(cleaned) > 500 else cleaned
-        raise ValueError(
-            f"Failed to parse JSON: {str(e)}\n"
-            f"Content preview: {preview}..."
-        )
+        return orjson.loads(cleaned)
+    except orjson.JSONDecodeError as e:
+        error = e
+    
+    # Fallback: pull the outermost balanced JSON value out of surrounding text
+    candidate = extract_balanced_json(cleaned)
+    if candidate:
+        try:
+            return orjson.loads(candidate)
+        except orjson.JSONDecodeError:
+            pass
+    
+    # Show preview of problematic content
+    preview = cleaned[:500] if len(cleaned) > 500 else cleaned
+    raise ValueError(
+        f"Failed to parse JSON: {str(error)}\n"
+        f"Content preview: {preview}..."
+    )
 
 
 def validate_file_type(filename: str, allowed_extensions: list = None) -> bool:
@@ -103,14 +176,12 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    # Remove or replace unsafe characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    
-    # Replace spaces with underscores
-    filename = filename.replace(' ', '_')
+    # Replace unsafe characters and spaces with underscores
+    filename = filename.translate(_UNSAFE_FILENAME_TABLE)
     
     # Remove multiple consecutive underscores
-    filename = re.sub(r'_+', '_', filename)
+    while '__' in filename:
+        filename = filename.replace('__', '_')
     
     # Limit length
     name, ext = os.path.splitext(filename)
@@ -150,15 +221,41 @@ def merge_dicts(dict1: dict, dict2: dict) -> dict:
     """
     result = dict1.copy()
     
-    for key, value in dict2.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_dicts(result[key], value)
-        else:
-            result[key] = value
+    # (merged dict, updates) pairs still to apply; only branches present in both are copied
+    stack = [(result, dict2)]
+    while stack:
+        target, updates = stack.pop()
+        for key, value in updates.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                target[key] = current.copy()
+                stack.append((target[key], value))
+            else:
+                target[key] = value
     
     return result
 
 
+def flatten_strings(value: Any) -> Iterator[str]:
+    """
+    Yield the string values nested in dicts/lists/tuples (dict keys are skipped)
+    
+    Args:
+        value: Parsed resume data or any part of it
+        
+    Returns:
+        Iterator over the string leaves, in document order
+    """
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from flatten_strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from flatten_strings(item)
+
+
 def extract_keywords_simple(text: str, min_length: int = 4) -> list:
     """
     Extract keywords from text using simple tokenization
@@ -170,21 +267,13 @@ def extract_keywords_simple(text: str, min_length: int = 4) -> list:
     Returns:
         List of keywords
     """
-    # Common stop words to filter out 
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
-        'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should',
-        'could', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those'
-    }
-    
     # Extract words
-    words = re.findall(r'\b[a-z]+\b', text.lower())
+    words = _LOWER_WORD_RE.findall(text.lower())
     
     # Filter
     keywords = [
         word for word in words
-        if len(word) >= min_length and word not in stop_words
+        if len(word) >= min_length and word not in STOP_WORDS
     ]
     
     # Remove duplicates while preserving order 
@@ -226,13 +315,8 @@ def normalize_whitespace(text: str) -> str:
     Returns:
         Normalized text
     """
-    # Replace multiple spaces with single space
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove leading/trailing whitespace
-    text = text.strip()
-    
-    return text
+    # Collapse whitespace runs to single spaces; split() also drops leading/trailing whitespace
+    return ' '.join(text.split())
 
 
 def is_valid_email(email: str) -> bool:
@@ -245,8 +329,7 @@ def is_valid_email(email: str) -> bool:
     Returns:
         True if valid format, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def is_valid_phone(phone: str) -> bool:
@@ -260,7 +343,7 @@ def is_valid_phone(phone: str) -> bool:
         True if valid format, False otherwise
     """
     # Remove common formatting characters
-    cleaned = re.sub(r'[\s\-\(\)\.]', '', phone)
+    cleaned = _PHONE_FORMATTING_RE.sub('', phone)
     
     # Check if it's digits and reasonable length
     return cleaned.isdigit() and 10 <= len(cleaned) <= 15
@@ -332,7 +415,7 @@ def clean_html_tags(text: str) -> str:
     Returns:
         Clean text
     """
-    clean = re.sub(r'<[^>]+>', '', text)
+    clean = _HTML_TAG_RE.sub('', text)
     return normalize_whitespace(clean)
 
 
@@ -363,15 +446,12 @@ def create_slug(text: str, max_length: int = 50) -> str:
     # Convert to lowercase
     slug = text.lower()
     
-    # Replace spaces and special chars with hyphens
-    slug = re.sub(r'[^a-z0-9]+', '-', slug)
+    # Replace each run of spaces and special chars (hyphens included) with a single hyphen
+    slug = _NON_SLUG_CHARS_RE.sub('-', slug)
     
     # Remove leading/trailing hyphens
     slug = slug.strip('-')
     
-    # Remove multiple consecutive hyphens
-    slug = re.sub(r'-+', '-', slug)
-    
     # Truncate
     if len(slug) > max_length:
         slug = slug[:max_length].rstrip('-')
@@ -410,10 +490,10 @@ def load_json_file(filepath: str) -> dict:
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"File not found: {filepath}")
     
-    with open(filepath, 'r', encoding='utf-8') as f:
+    with open(filepath, 'rb') as f:
         try:
-            return json.load(f)
-        except json.JSONDecodeError as e:
+            return orjson.loads(f.read())
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in {filepath}: {str(e)}")
 
 
@@ -426,11 +506,10 @@ def save_json_file(data: dict, filepath: str, pretty: bool = True):
         filepath: Output file path
         pretty: Whether to pretty-print
     """
-    with open(filepath, 'w', encoding='utf-8') as f:
-        if pretty:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        else:
-            json.dump(data, f, ensure_ascii=False)
+    # orjson writes UTF-8 bytes directly; OPT_NON_STR_KEYS keeps int keys working as with json.dump
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+    with open(filepath, 'wb') as f:
+        f.write(orjson.dumps(data, option=option))
 
 
 def count_words(text: str) -> int:
@@ -443,7 +522,7 @@ def count_words(text: str) -> int:
     Returns:
         Word count
     """
-    words = re.findall(r'\b\w+\b', text)
+    words = _WORD_RE.findall(text)
     return len(words)
 
 
@@ -454,7 +533,6 @@ def get_timestamp() -> str:
     Returns:
         ISO format timestamp
     """
-    from datetime import datetime
     return datetime.now().isoformat()
 
 
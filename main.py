@@ -5,7 +5,8 @@ Main FastAPI application with hybrid processing (rule-based + LLM fallback)
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.routes_hybrid import router
+from fastapi.responses import ORJSONResponse
+from app.api.routes_hybrid import router, shutdown_process_pool
 from app.utils.helpers import ensure_directories
 import uvicorn
 
@@ -33,7 +34,8 @@ app = FastAPI(
     """,
     version="2.0.0",
     docs_url="/",  # Swagger UI at root
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse  # orjson-backed JSON serialization
 )
 
 
@@ -81,7 +83,10 @@ def startup_event():
 def shutdown_event():
     """
     Execute on application shutdown
+    - Stop the worker processes used by /analyze_batch and /optimize
     """
+    shutdown_process_pool()
+    
     print("\n" + "="*70)
     print("🛑 ATS Resume Optimizer API - Shutting down...")
     print("="*70 + "\n")